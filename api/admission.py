@@ -0,0 +1,185 @@
+"""
+api.admission
+~~~~~~~~~~~~~~~~~~~
+
+Admission control for scrape requests: a global cap on concurrent scrapes
+with a bounded wait queue, plus per-client concurrency and rate limits.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+
+from cachetools import TTLCache
+from fastapi import HTTPException, Request
+
+
+def client_id(request: Request) -> str:
+    """
+    Identifies the caller by API key when one is sent, otherwise by address.
+    """
+    api_key = request.headers.get("x-api-key")
+    if api_key:
+        return f"key:{api_key}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """
+        Takes a token if available
+        :return: 0 on success, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        max_waiting: int = 16,
+        max_wait: float = 30.0,
+        client_concurrent: int = 2,
+        client_rate: float = 10 / 60,
+        client_burst: int = 5,
+    ):
+        """
+        :param max_concurrent: scrapes allowed to run at once
+        :param max_waiting: scrapes allowed to queue for a slot before 503s
+        :param max_wait: seconds a queued scrape waits before giving up
+        :param client_concurrent: scrapes one client may run or queue at once
+        :param client_rate: sustained scrapes per second per client; 0 for
+            no rate limit
+        :param client_burst: scrapes a client may issue back to back
+        """
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.max_wait = max_wait
+        self.client_concurrent = client_concurrent
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # an idle client's bucket is full again after burst / rate seconds
+        self._buckets: TTLCache = TTLCache(
+            maxsize=10000, ttl=client_burst / client_rate if client_rate > 0 else 1
+        )
+        self._in_flight: Counter = Counter()
+        self.active = 0
+        self.waiting = 0
+        self.counters: Counter = Counter()
+        self.total_wait = 0.0
+        self.max_observed_wait = 0.0
+
+    @asynccontextmanager
+    async def admit(self, client: str):
+        """
+        Holds a scrape slot for the duration of the block.
+        :raises HTTPException: 429 when the client is over its limits, 503 when
+            the wait queue is full or the wait times out
+        """
+        if self._in_flight[client] >= self.client_concurrent:
+            self._reject("client_busy", 429, "Too many concurrent searches")
+        if self.active >= self.max_concurrent and self.waiting >= self.max_waiting:
+            self._reject("queue_full", 503, "Too many searches in progress")
+        # spent last, so a request turned away for capacity keeps its token
+        self._take_token(client)
+
+        self._in_flight[client] += 1
+        self.waiting += 1
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            self._release_client(client)
+            self._reject("wait_timeout", 503, "Timed out waiting for a search slot")
+        except BaseException:
+            self._release_client(client)
+            raise
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - started
+        self.total_wait += waited
+        self.max_observed_wait = max(self.max_observed_wait, waited)
+        self.counters["admitted"] += 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+            self._release_client(client)
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Holds a scrape slot for work queued and limited per client elsewhere
+        (background searches), waiting for as long as it takes.
+        """
+        await self._semaphore.acquire()
+        self.counters["admitted_background"] += 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    def _take_token(self, client: str) -> None:
+        if self.client_rate <= 0:
+            return
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = TokenBucket(self.client_rate, self.client_burst)
+        self._buckets[client] = bucket
+        wait = bucket.take()
+        if wait:
+            self._reject("rate_limited", 429, "Search rate limit exceeded", wait)
+
+    def _release_client(self, client: str) -> None:
+        self._in_flight[client] -= 1
+        if self._in_flight[client] <= 0:
+            del self._in_flight[client]
+
+    def _reject(
+        self, reason: str, status_code: int, detail: str, retry_after: float = None
+    ):
+        self.counters[f"rejected_{reason}"] += 1
+        if retry_after is None:
+            # roughly one scrape's worth of time for a slot to free up
+            retry_after = max(1.0, self.max_wait / max(1, self.max_concurrent))
+        raise HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    def snapshot(self) -> dict:
+        admitted = self.counters["admitted"]
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_waiting": self.max_waiting,
+            "clients_in_flight": len(self._in_flight),
+            "avg_wait_seconds": self.total_wait / admitted if admitted else 0.0,
+            "max_wait_seconds": self.max_observed_wait,
+            **self.counters,
+        }
@@ -1,12 +1,21 @@
-import logging
 import json
+import logging
+import math
+import os
+from contextlib import AsyncExitStack
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-import pandas as pd
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool, iterate_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from starlette.background import BackgroundTask
 
 # ✅ Use proper import (assuming jobspy is a local package in your project root)
-from .jobspy import scrape_jobs
+from .jobspy import Site, Country, JobType, scrape_jobs, scrape_jobs_bulk, get_desired_order
+from .jobspy.export import EXPORT_FORMATS, export_records
+from ..store import ResultStore, ResultSet, SORT_OPTIONS, project
+from ..admission import AdmissionController, client_id
+from ..searches import DONE, Search, SearchRunner
 
 # Configure logger
 logging.basicConfig(level=logging.INFO)
@@ -14,38 +23,223 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["jobs"])
 
+# Scraped result sets are kept server-side so filtering and paging never re-scrape
+result_store = ResultStore()
+
+admission = AdmissionController(
+    max_concurrent=int(os.getenv("JOBS_MAX_CONCURRENT_SCRAPES", 4)),
+    max_waiting=int(os.getenv("JOBS_MAX_QUEUED_SCRAPES", 16)),
+    max_wait=float(os.getenv("JOBS_MAX_QUEUE_WAIT", 30)),
+    client_concurrent=int(os.getenv("JOBS_CLIENT_CONCURRENT_SCRAPES", 2)),
+    client_rate=float(os.getenv("JOBS_CLIENT_SCRAPES_PER_MINUTE", 10)) / 60,
+    client_burst=int(os.getenv("JOBS_CLIENT_SCRAPE_BURST", 5)),
+)
+
+
+# scrape_jobs arguments shared by every search the API runs
+SEARCH_DEFAULTS = dict(
+    fetch_job_details=True,
+    annual_currency="GBP",
+    # comma separated proxy urls, pooled across all scrapes
+    proxy=[p.strip() for p in os.getenv("JOBS_PROXIES", "").split(",") if p.strip()] or None,
+    linkedin_parallel_pages=os.getenv("JOBS_LINKEDIN_PARALLEL_PAGES", "0") == "1",
+)
+DEFAULT_SITES = ["indeed", "linkedin", "glassdoor", "the_guardian", "cv_library", "builtin"]
+MAX_RESULTS_WANTED = int(os.getenv("JOBS_MAX_RESULTS_WANTED", 100))
+
+BULK_MAX_SEARCHES = int(os.getenv("JOBS_BULK_MAX_SEARCHES", 100))
+BULK_MAX_WORKERS = int(os.getenv("JOBS_BULK_MAX_WORKERS", 8))
+BULK_MAX_PER_SITE = int(os.getenv("JOBS_BULK_MAX_PER_SITE", 2))
+BULK_SITE_RATE = float(os.getenv("JOBS_BULK_SITE_RATE", 1))
+SEARCH_WORKERS = int(os.getenv("JOBS_SEARCH_WORKERS", 4))
+SEARCH_MAX_QUEUED = int(os.getenv("JOBS_SEARCH_MAX_QUEUED", 64))
+SEARCH_CLIENT_QUEUED = int(os.getenv("JOBS_SEARCH_CLIENT_QUEUED", 8))
+SEARCH_TTL = int(os.getenv("JOBS_SEARCH_TTL", 900))
+
 
 class JobsSearch(BaseModel):
     keyword: str
+    sites: list[str] | None = Field(None, description="Defaults to every supported board")
+    location: str | None = "United Kingdom"
+    country: str = Field("uk", description="Country for Indeed and Glassdoor")
+    results_wanted: int = Field(50, ge=1, le=MAX_RESULTS_WANTED, description="Per site")
+    hours_old: int | None = Field(None, ge=1)
+    is_remote: bool = False
+    job_type: str | None = Field(None, description="e.g. fulltime, parttime, contract")
+    description_format: str = Field("html", pattern="^(html|markdown)$")
+    total_results: int | None = Field(
+        None, ge=1, le=MAX_RESULTS_WANTED, description="Stop every site once this many jobs are found"
+    )
+    min_per_site: int = Field(0, ge=0, le=MAX_RESULTS_WANTED)
+    plan: bool = Field(
+        False, description="Plan sites and pages from past yield; results_wanted is then the total"
+    )
+    latency_target: float = Field(20, ge=1, le=120, description="Seconds, for planned searches")
+    fields: list[str] | None = Field(
+        None, description="Columns needed; boards that can skip fetching the rest, which may come back empty"
+    )
+
+    @field_validator("sites")
+    @classmethod
+    def check_sites(cls, sites: list[str] | None) -> list[str] | None:
+        for site in sites or ():
+            if site.upper() not in Site.__members__:
+                raise ValueError(f"Unknown site: {site}")
+        return sorted(set(site.lower() for site in sites)) if sites else None
+
+    @field_validator("fields")
+    @classmethod
+    def check_fields(cls, fields: list[str] | None) -> list[str] | None:
+        if fields is None:
+            return None
+        unknown = set(fields) - set(get_desired_order())
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        return sorted(set(fields))
+
+    @field_validator("country")
+    @classmethod
+    def check_country(cls, country: str) -> str:
+        Country.from_string(country)
+        return country.strip().lower()
+
+    @field_validator("job_type")
+    @classmethod
+    def check_job_type(cls, job_type: str | None) -> str | None:
+        if job_type is None:
+            return None
+        job_type = job_type.replace("-", "").replace(" ", "").lower()
+        if not any(job_type in member.value for member in JobType):
+            raise ValueError(f"Unknown job type: {job_type}")
+        return job_type
+
+    def scrape_args(self) -> dict:
+        """
+        Maps the search onto scrape_jobs arguments.
+        """
+        return dict(
+            SEARCH_DEFAULTS,
+            site_name=self.sites or DEFAULT_SITES,
+            search_term=self.keyword,
+            location=self.location,
+            country_indeed=self.country,
+            results_wanted=self.results_wanted,
+            hours_old=self.hours_old,
+            is_remote=self.is_remote,
+            job_type=self.job_type,
+            description_format=self.description_format,
+            total_results=self.total_results,
+            min_per_site=self.min_per_site,
+            plan_search=self.plan,
+            latency_target=self.latency_target,
+            fields=self.fields,
+        )
+
+
+class BulkJobsSearch(BaseModel):
+    searches: list[JobsSearch] = Field(min_length=1, max_length=BULK_MAX_SEARCHES)
+
+
+class ResultQuery:
+    """
+    Filter, sort and pagination query parameters shared by the list endpoints.
+    """
+
+    def __init__(
+        self,
+        site: str | None = Query(None, description="Comma separated site names"),
+        job_type: str | None = Query(None, description="e.g. fulltime, contract"),
+        is_remote: bool | None = Query(None),
+        days: int | None = Query(None, ge=1, description="Maximum age in days"),
+        min_salary: float | None = Query(None, ge=0, description="Minimum annual pay in GBP"),
+        sort: str = Query("date_desc", pattern=f"^({'|'.join(SORT_OPTIONS)})$"),
+        page: int = Query(1, ge=1),
+        limit: int = Query(20, ge=1, le=100),
+        snippet_length: int = Query(150, ge=0, le=1000),
+    ):
+        self.site = [s.strip() for s in site.split(",") if s.strip()] if site else None
+        self.job_type = job_type.replace("-", "") if job_type else None
+        self.is_remote = is_remote
+        self.days = days
+        self.min_salary = min_salary
+        self.sort = sort
+        self.page = page
+        self.limit = limit
+        self.snippet_length = snippet_length
+
+
+class SiteProgress:
+    """
+    Collects scrape_jobs progress callbacks for a synchronous search.
+    """
+
+    def __init__(self):
+        self.sites: dict[str, str] = {}
+
+    def update(self, site: str, status: str, jobs: int = 0) -> None:
+        self.sites[site] = status
+
+    def degraded(self) -> list[str]:
+        return [site for site, status in self.sites.items() if status == "degraded"]
+
+
+def filter_jobs(result_set: ResultSet, query: ResultQuery) -> list[dict]:
+    return result_set.query(
+        site=query.site,
+        job_type=query.job_type,
+        is_remote=query.is_remote,
+        days=query.days,
+        min_salary=query.min_salary,
+        sort=query.sort,
+    )
+
+
+def paginate(result_set: ResultSet, query: ResultQuery) -> dict:
+    jobs = filter_jobs(result_set, query)
+    start = (query.page - 1) * query.limit
+    return {
+        "result_id": result_set.id,
+        "total": len(jobs),
+        "page": query.page,
+        "limit": query.limit,
+        "pages": math.ceil(len(jobs) / query.limit),
+        "degraded": result_set.degraded,
+        "plan": result_set.plan,
+        "data": [
+            project(job, query.snippet_length)
+            for job in jobs[start : start + query.limit]
+        ],
+    }
 
 
 @router.post("/jobs")
-async def search_jobs(jobSearch: JobsSearch):
+async def search_jobs(
+    jobSearch: JobsSearch, request: Request, query: ResultQuery = Depends()
+):
+    key = jobSearch.model_dump_json(exclude_none=True)
+    result_set = result_store.find(key)
+    if result_set is not None:
+        return paginate(result_set, query)
+
+    async with admission.admit(client_id(request)):
+        result_set = await run_search(key, jobSearch)
+    return paginate(result_set, query)
+
+
+async def run_search(key: str, jobSearch: JobsSearch) -> ResultSet:
     try:
-        jobs: pd.DataFrame = scrape_jobs(
-            site_name=["indeed", "linkedin", "glassdoor", "the_guardian", "cv_library", "builtin"],
-            search_term=jobSearch.keyword,
-            description_format="html",
-            location="United Kingdom",
-            results_wanted=50,
-            country_indeed="uk",
+        sites = SiteProgress()
+        plan_report = {}
+        jobs: list[dict] = await run_in_threadpool(
+            scrape_jobs,
+            **jobSearch.scrape_args(),
+            return_as="records",
+            progress=sites.update,
+            plan_report=plan_report,
         )
-
-        if jobs.empty:
+        if not jobs:
             logger.warning("No jobs found")
-            return {"data": []}
-
-        # Convert DataFrame -> JSON string -> Python list/dict
-        json_data = jobs.to_json(
-            orient="records",
-            date_format="iso",
-            double_precision=10,
-            force_ascii=False,
-            date_unit="ms"
-        )
-        python_dict = json.loads(json_data)
-
-        return {"data": python_dict}
+        return result_store.put(key, jobs, sites.degraded(), plan_report or None)
 
     except ValueError as e:
         logger.error(f"ValueError: {e}")
@@ -54,3 +248,169 @@ async def search_jobs(jobSearch: JobsSearch):
     except Exception as e:
         logger.exception("Internal server error")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/jobs/bulk")
+async def search_jobs_bulk(
+    bulkSearch: BulkJobsSearch, request: Request, query: ResultQuery = Depends()
+):
+    """
+    Runs many keyword searches as one scrape workload and streams one NDJSON
+    line per search as it completes. Each line carries the first page of
+    results and a result_id for further paging or export. Searches already
+    in the result store are answered first without scraping.
+    """
+    cached, pending = [], []
+    for search in bulkSearch.searches:
+        key = search.model_dump_json(exclude_none=True)
+        result_set = result_store.find(key)
+        if result_set is not None:
+            cached.append((search, result_set))
+        else:
+            pending.append((search, key))
+
+    # hold one admission slot for the whole workload, taken before the
+    # response starts so rejections are still proper 429/503 responses. The
+    # stream releases it when it ends; the background task also releases it
+    # when the client disconnects before the stream is ever iterated
+    slot = AsyncExitStack()
+    if pending:
+        await slot.enter_async_context(admission.admit(client_id(request)))
+
+    def line(search: JobsSearch, result_set: ResultSet = None, errors: dict = None) -> str:
+        body = paginate(result_set, query) if result_set is not None else {}
+        return (
+            json.dumps(
+                {"keyword": search.keyword, "sites": search.sites, "errors": errors or {}, **body},
+                default=str,
+            )
+            + "\n"
+        )
+
+    async def stream():
+        async with slot:
+            for search, result_set in cached:
+                yield line(search, result_set)
+            if not pending:
+                return
+            results = scrape_jobs_bulk(
+                [search.scrape_args() for search, _ in pending],
+                max_workers=BULK_MAX_WORKERS,
+                max_per_site=BULK_MAX_PER_SITE,
+                site_rate=BULK_SITE_RATE,
+            )
+            try:
+                async for index, jobs, errors in iterate_in_threadpool(results):
+                    search, key = pending[index]
+                    yield line(search, result_store.put(key, jobs, list(errors)), errors)
+            except Exception as e:
+                logger.exception("Bulk search failed")
+                yield json.dumps({"error": str(e)}) + "\n"
+
+    return StreamingResponse(
+        stream(), media_type="application/x-ndjson", background=BackgroundTask(slot.aclose)
+    )
+
+
+@router.get("/results/{result_id}")
+async def get_results(result_id: str, query: ResultQuery = Depends()):
+    result_set = result_store.get(result_id)
+    if result_set is None:
+        raise HTTPException(status_code=404, detail="Result set expired or not found")
+    return paginate(result_set, query)
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = result_store.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job expired or not found")
+    return {"data": job}
+
+
+@router.get("/results/{result_id}/export")
+async def export_results(
+    result_id: str,
+    format: str = Query("csv", pattern=f"^({'|'.join(EXPORT_FORMATS)})$"),
+    query: ResultQuery = Depends(),
+):
+    """
+    Streams the whole filtered result set (paging parameters are ignored).
+    """
+    result_set = result_store.get(result_id)
+    if result_set is None:
+        raise HTTPException(status_code=404, detail="Result set expired or not found")
+    try:
+        chunks = export_records(
+            filter_jobs(result_set, query), format, columns=["id", *get_desired_order()]
+        )
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="jobs-{result_id}.{extension}"'
+        },
+    )
+
+
+def execute_search(search: Search) -> str:
+    plan_report = {}
+    jobs: list[dict] = scrape_jobs(
+        **search.params.scrape_args(),
+        return_as="records",
+        progress=search.update_site,
+        plan_report=plan_report,
+    )
+    degraded = [
+        site
+        for site, progress in search.snapshot()["sites"].items()
+        if progress["status"] == "degraded"
+    ]
+    return result_store.put(search.key, jobs, degraded, plan_report or None).id
+
+
+# Submitted searches run here, off the request path, so long scrapes don't
+# hold client connections open
+searches = SearchRunner(
+    execute=execute_search,
+    workers=SEARCH_WORKERS,
+    max_queued=SEARCH_MAX_QUEUED,
+    client_queued=SEARCH_CLIENT_QUEUED,
+    ttl=SEARCH_TTL,
+    admit=admission.slot,
+)
+
+
+@router.post("/searches", status_code=202)
+async def submit_search(jobSearch: JobsSearch, request: Request):
+    """
+    Queues a search and returns its id straight away; poll
+    GET /api/v1/searches/{search_id} for progress and results.
+    """
+    key = jobSearch.model_dump_json(exclude_none=True)
+    client = client_id(request)
+    result_set = result_store.find(key)
+    if result_set is not None:
+        search = searches.complete(client, key, jobSearch, result_set.id)
+    else:
+        search = searches.submit(client, key, jobSearch)
+    return {**search.snapshot(), "location": f"/api/v1/searches/{search.id}"}
+
+
+@router.get("/searches/{search_id}")
+async def get_search(search_id: str, query: ResultQuery = Depends()):
+    search = searches.get(search_id)
+    if search is None:
+        raise HTTPException(status_code=404, detail="Search expired or not found")
+    body = search.snapshot()
+    body["queue_position"] = searches.position(search)
+    if search.status == DONE:
+        result_set = result_store.get(search.result_id)
+        if result_set is None:
+            raise HTTPException(status_code=410, detail="Search results expired")
+        body["results"] = paginate(result_set, query)
+    return body
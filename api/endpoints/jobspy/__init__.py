@@ -1,25 +1,101 @@
 from __future__ import annotations
 
-import pandas as pd
-from typing import Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import importlib
+from datetime import date
+from collections import Counter, defaultdict, deque
+from typing import Callable, Iterator, TYPE_CHECKING
+from concurrent.futures import FIRST_COMPLETED, as_completed, wait
 
 from .jobs import JobType, Location
-from .scrapers.utils import logger, set_logger_level
-from .scrapers.indeed import IndeedScraper
-from .scrapers.ziprecruiter import ZipRecruiterScraper
-from .scrapers.glassdoor import GlassdoorScraper
-from .scrapers.linkedin import LinkedInScraper
-from .scrapers import ScraperInput, Site, JobResponse, Country
+from .scrapers.utils import logger, set_logger_level, RateLimiter
+from .scrapers.breaker import get_circuit_breaker
+from .scrapers.executors import get_executor
+from .scrapers.proxies import ProxyPool, get_proxy_pool
+from .planner import site_planner
+from .scrapers.salary import annualize
+from .scrapers import ScraperInput, Site, JobResponse, Country, ResultQuota
 from .scrapers.exceptions import (
     LinkedInException,
     IndeedException,
     ZipRecruiterException,
     GlassdoorException,
+    CircuitOpenException,
 )
-from .scrapers.theguardian import TheGuardianScraper
-from .scrapers.cvlibrary import CVLibraryScraper
-from .scrapers.builtin import BuiltinScraper
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Scraper modules pull in bs4, tls_client and friends, so they are only
+# imported the first time a search actually targets their site.
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: ".scrapers.linkedin:LinkedInScraper",
+    Site.INDEED: ".scrapers.indeed:IndeedScraper",
+    Site.ZIP_RECRUITER: ".scrapers.ziprecruiter:ZipRecruiterScraper",
+    Site.GLASSDOOR: ".scrapers.glassdoor:GlassdoorScraper",
+    Site.THE_GUARDIAN: ".scrapers.theguardian:TheGuardianScraper",
+    Site.CV_LIBRARY: ".scrapers.cvlibrary:CVLibraryScraper",
+    Site.BUILTIN: ".scrapers.builtin:BuiltinScraper",
+}
+
+
+_SCRAPER_CLASSES = {
+    path.partition(":")[2]: site for site, path in SCRAPER_MAPPING.items()
+}
+
+
+def __getattr__(name: str):
+    # keeps `from jobspy import IndeedScraper` working without eager imports
+    if name in _SCRAPER_CLASSES:
+        return get_scraper_class(_SCRAPER_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_scraper_class(site: Site):
+    """
+    Resolves the scraper class for a site, importing its module on first use.
+    """
+    module_name, _, class_name = SCRAPER_MAPPING[site].partition(":")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)
+
+
+def get_desired_order(hyperlinks: bool = False) -> list[str]:
+    """
+    Column order of the scraped result set.
+    """
+    return [
+        "site",
+        "job_url_hyper" if hyperlinks else "job_url",
+        "job_url_direct",
+        "title",
+        "company",
+        "location",
+        "job_type",
+        "date_posted",
+        "interval",
+        "min_amount",
+        "max_amount",
+        "currency",
+        "annual_min_amount",
+        "annual_max_amount",
+        "annual_currency",
+        "is_remote",
+        "emails",
+        "description",
+        "company_url",
+        "company_url_direct",
+        "company_addresses",
+        "company_industry",
+        "company_num_employees",
+        "company_revenue",
+        "company_description",
+        "logo_photo_url",
+        "banner_photo_url",
+        "ceo_name",
+        "ceo_photo_url",
+    ]
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -32,30 +108,319 @@ def scrape_jobs(
     results_wanted: int = 15,
     country_indeed: str = "usa",
     hyperlinks: bool = False,
-    proxy: str | None = None,
+    proxy: str | list[str] | ProxyPool | None = None,
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
+    linkedin_parallel_pages: bool = False,
+    fetch_job_details: bool = False,
     linkedin_company_ids: list[int] | None = None,
     offset: int | None = 0,
     hours_old: int = None,
     verbose: int = 2,
+    annual_currency: str = "USD",
+    return_as: str = "dataframe",
+    progress: Callable[[str, str, int], None] | None = None,
+    total_results: int | None = None,
+    min_per_site: int = 0,
+    plan_search: bool = False,
+    latency_target: float = 20.0,
+    plan_report: dict | None = None,
+    fields: list[str] | None = None,
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | list[dict]:
     """
     Simultaneously scrapes job data from multiple job sites.
-    :return: pandas dataframe containing job data
-    """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedInScraper,
-        Site.INDEED: IndeedScraper,
-        Site.ZIP_RECRUITER: ZipRecruiterScraper,
-        Site.GLASSDOOR: GlassdoorScraper,
-        Site.THE_GUARDIAN: TheGuardianScraper,
-        Site.CV_LIBRARY: CVLibraryScraper,
-        Site.BUILTIN: BuiltinScraper,
-    }
+    :param proxy: proxy url, or a list of urls (or a ProxyPool) that every
+        site scrape leases a healthy proxy from
+    :param linkedin_parallel_pages: fetch LinkedIn search pages concurrently
+        by start offset, under the shared LinkedIn rate limit, instead of one
+        by one with pauses in between
+    :param fetch_job_details: enrich sites that only list summaries (The
+        Guardian, CV-Library) from their job detail pages
+    :param annual_currency: currency of the annualized salary columns
+    :param progress: called from the scraping threads with (site, status,
+        jobs found) as each site goes "running", then "done", "failed" or
+        "degraded" (the site errored, or its circuit breaker skipped it)
+    :param total_results: global quota; once the sites together found this
+        many jobs (and each found min_per_site), every site stops after its
+        current page and the merged result is cut down to the quota
+    :param min_per_site: jobs each site contributes before the quota counts
+        as met
+    :param plan_search: let the site planner pick sites, their order and
+        pages from past yield and latency; results_wanted then counts jobs
+        across all sites, and doubles as total_results unless that is given
+    :param latency_target: seconds the planner aims to finish within
+    :param plan_report: filled with the plan and its outcome when planning
+    :param fields: columns the caller needs (see get_desired_order); sites
+        that can (Indeed) leave the others out of their requests, so those
+        columns may come back empty
+    :param return_as: "dataframe" (default) or "records" for a list of dicts,
+        which avoids importing pandas altogether
+    :return: pandas dataframe (or list of records) containing job data
+    """
+    if return_as not in ("dataframe", "records"):
+        raise ValueError(f"Invalid return_as: {return_as}")
     set_logger_level(verbose)
 
+    scraper_input = build_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_parallel_pages=linkedin_parallel_pages,
+        fetch_job_details=fetch_job_details,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        fields=fields,
+    )
+
+    site_inputs = {site: scraper_input for site in scraper_input.site_type}
+    plan = None
+    if plan_search:
+        plan, site_inputs = plan_site_inputs(scraper_input, latency_target)
+        total_results = total_results or results_wanted
+
+    site_to_jobs_dict = {}
+    site_seconds = {}
+    quota = ResultQuota(total_results, min_per_site) if total_results else None
+    if quota is not None:
+        for site in site_inputs:
+            quota.start(site.value)
+
+    report = progress or (lambda site, status, jobs: None)
+
+    def worker(site: Site) -> JobResponse:
+        report(site.value, "running", 0)
+        started = time.monotonic()
+        try:
+            job_response = scrape_site(site, site_inputs[site], proxy, quota)
+        except CircuitOpenException as e:
+            logger.warning(str(e))
+            report(site.value, "degraded", 0)
+            return JobResponse(jobs=[], error=str(e))
+        except Exception:
+            report(site.value, "failed", 0)
+            raise
+        finally:
+            site_seconds[site.value] = time.monotonic() - started
+        status = "degraded" if job_response.error else "done"
+        report(site.value, status, len(job_response.jobs))
+        return job_response
+
+    executor = get_executor("io")
+    # in plan order, best value sites first
+    future_to_site = {executor.submit(worker, site): site for site in site_inputs}
+    for future in as_completed(future_to_site):
+        site_to_jobs_dict[future_to_site[future].value] = future.result()
+
+    records = build_records(site_to_jobs_dict, hyperlinks, annual_currency)
+    duplicate_rates = site_planner.record_duplicates(search_term, records)
+    if quota is not None:
+        records = _apply_quota(records, total_results, min_per_site)
+    if plan is not None:
+        outcome = {
+            "jobs": len(records),
+            "seconds": round(max(site_seconds.values(), default=0), 1),
+            "sites": {
+                site: {
+                    "jobs": len(job_response.jobs),
+                    "seconds": round(site_seconds.get(site, 0), 1),
+                    "duplicate_rate": round(duplicate_rates.get(site, 0.0), 3),
+                    "error": job_response.error,
+                }
+                for site, job_response in site_to_jobs_dict.items()
+            },
+        }
+        site_planner.record_outcome(plan, outcome)
+        if plan_report is not None:
+            plan_report.update(plan=plan, outcome=outcome)
+
+    if return_as == "records":
+        return records
+
+    import pandas as pd
+
+    if not records:
+        return pd.DataFrame()
+    return pd.DataFrame.from_records(records, columns=get_desired_order(hyperlinks))
+
+
+def scrape_jobs_bulk(
+    searches: list[dict],
+    max_workers: int = 8,
+    max_per_site: int = 2,
+    site_rate: float = 1.0,
+    **kwargs,
+) -> Iterator[tuple[int, list[dict], dict[str, str]]]:
+    """
+    Runs many searches as one workload over a shared thread budget.
+
+    Every (search, site) pair is a task. At most max_workers tasks run at
+    once, at most max_per_site of them against the same site, and task starts
+    per site are spaced to site_rate per second. Sites are served round-robin
+    so one busy board doesn't starve the others. Sessions, csrf tokens and
+    response caches are shared between tasks through the scrapers' module
+    level pools.
+    :param searches: scrape_jobs arguments per search, e.g.
+        {"search_term": "python", "site_name": ["indeed"]}, overriding kwargs;
+        plan_search and latency_target plan each search's sites as in
+        scrape_jobs
+    :param kwargs: scrape_jobs arguments common to all searches
+    :return: iterator of (search index, records, error message by site) in
+        the order searches complete
+    """
+    set_logger_level(kwargs.pop("verbose", 2))
+    kwargs.pop("return_as", None)
+
+    plans = []
+    tasks: dict[Site, deque] = defaultdict(deque)
+    for index, search in enumerate(searches):
+        params = {**kwargs, **search}
+        hyperlinks = params.pop("hyperlinks", False)
+        proxy = params.pop("proxy", None)
+        annual_currency = params.pop("annual_currency", "USD")
+        total_results = params.pop("total_results", None)
+        min_per_site = params.pop("min_per_site", 0)
+        plan_search = params.pop("plan_search", False)
+        latency_target = params.pop("latency_target", 20.0)
+        scraper_input = build_scraper_input(**params)
+        site_inputs = {site: scraper_input for site in scraper_input.site_type}
+        if plan_search:
+            _, site_inputs = plan_site_inputs(scraper_input, latency_target)
+            total_results = total_results or scraper_input.results_wanted
+        quota = ResultQuota(total_results, min_per_site) if total_results else None
+        for site in site_inputs if quota is not None else ():
+            quota.start(site.value)
+        plans.append(
+            dict(
+                scraper_input=scraper_input,
+                site_inputs=site_inputs,
+                proxy=proxy,
+                hyperlinks=hyperlinks,
+                annual_currency=annual_currency,
+                quota=quota,
+            )
+        )
+        for site in site_inputs:
+            tasks[site].append(index)
+
+    site_jobs = [{} for _ in plans]
+    errors = [{} for _ in plans]
+    remaining = [len(plan["site_inputs"]) for plan in plans]
+    limiters = {site: RateLimiter(site_rate) for site in tasks}
+    running: Counter = Counter()
+    futures = {}
+
+    def run(site: Site, index: int) -> JobResponse:
+        limiters[site].wait()
+        plan = plans[index]
+        return scrape_site(site, plan["site_inputs"][site], plan["proxy"], plan["quota"])
+
+    def dispatch():
+        dispatched = True
+        while dispatched and len(futures) < max_workers:
+            dispatched = False
+            for site, queue in tasks.items():
+                if queue and running[site] < max_per_site and len(futures) < max_workers:
+                    index = queue.popleft()
+                    running[site] += 1
+                    futures[executor.submit(run, site, index)] = (site, index)
+                    dispatched = True
+
+    executor = get_executor("io")
+    try:
+        for index, count in enumerate(remaining):
+            if count == 0:
+                # the planner skipped every site of this search
+                yield index, [], errors[index]
+        dispatch()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                site, index = futures.pop(future)
+                running[site] -= 1
+                try:
+                    job_response = site_jobs[index][site.value] = future.result()
+                    if job_response.error:
+                        errors[index][site.value] = job_response.error
+                except Exception as e:
+                    logger.error(f"{site.value} failed for search {index}: {e}")
+                    errors[index][site.value] = str(e)
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    plan = plans[index]
+                    records = build_records(
+                        site_jobs[index], plan["hyperlinks"], plan["annual_currency"]
+                    )
+                    site_planner.record_duplicates(plan["scraper_input"].search_term, records)
+                    if plan["quota"] is not None:
+                        records = _apply_quota(
+                            records, plan["quota"].total, plan["quota"].min_per_site
+                        )
+                    site_jobs[index] = None
+                    yield index, records, errors[index]
+            dispatch()
+    finally:
+        # a closed generator leaves nothing queued on the shared pool
+        for future in futures:
+            future.cancel()
+
+
+def plan_site_inputs(
+    scraper_input: ScraperInput, latency_target: float
+) -> tuple[dict, dict[Site, ScraperInput]]:
+    """
+    Lets the site planner pick the sites, their order and results_wanted
+    for a search; scraper_input.results_wanted counts jobs across all sites.
+    :return: the plan, and the scraper input of every planned site in
+        query order
+    """
+    plan = site_planner.plan(
+        scraper_input.search_term,
+        [site.value for site in scraper_input.site_type],
+        scraper_input.results_wanted,
+        latency_target,
+    )
+    site_inputs = {
+        Site(entry["site"]): scraper_input.model_copy(
+            update={"results_wanted": entry["results_wanted"]}
+        )
+        for entry in plan["sites"]
+    }
+    return plan, site_inputs
+
+
+def build_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_parallel_pages: bool = False,
+    fetch_job_details: bool = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    fields: list[str] | None = None,
+) -> ScraperInput:
+    """
+    Validates scrape_jobs arguments into a ScraperInput.
+    """
+
     def map_str_to_site(site_name: str) -> Site:
         return Site[site_name.upper()]
 
@@ -66,6 +431,9 @@ def scrape_jobs(
         raise Exception(f"Invalid job type: {value_str}")
 
     job_type = get_enum_from_value(job_type) if job_type else None
+    unknown_fields = set(fields or ()) - {"job_url_hyper", *get_desired_order()}
+    if unknown_fields:
+        raise ValueError(f"Invalid fields: {', '.join(sorted(unknown_fields))}")
 
     def get_site_type():
         site_types = list(Site)
@@ -82,7 +450,7 @@ def scrape_jobs(
 
     country_enum = Country.from_string(country_indeed)
 
-    scraper_input = ScraperInput(
+    return ScraperInput(
         site_type=get_site_type(),
         country=country_enum,
         search_term=search_term,
@@ -93,123 +461,162 @@ def scrape_jobs(
         easy_apply=easy_apply,
         description_format=description_format,
         linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_parallel_pages=linkedin_parallel_pages,
+        fetch_job_details=fetch_job_details,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
         offset=offset,
         hours_old=hours_old,
+        fields=frozenset(fields) if fields is not None else None,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxy=proxy)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        logger.info(f"{site_name} finished scraping")
-        return site.value, scraped_data
 
-    site_to_jobs_dict = {}
+def scrape_site(
+    site: Site,
+    scraper_input: ScraperInput,
+    proxy: str | list[str] | ProxyPool | None = None,
+    quota: ResultQuota | None = None,
+) -> JobResponse:
+    """
+    Runs one site's scraper behind the site's circuit breaker.
+    :param proxy: a proxy url, or a list of them / ProxyPool to lease one
+        from for the duration of the scrape
+    :param quota: search-wide quota the scraper's pagination reports to
+    :raises CircuitOpenException: the site is failing and was skipped
+    """
+    pool = get_proxy_pool(proxy) if isinstance(proxy, (list, tuple)) else proxy
+    if not isinstance(pool, ProxyPool):
+        pool = None
+    try:
+        breaker = get_circuit_breaker(site.value)
+        if not breaker.allow():
+            raise CircuitOpenException(f"{site.value} is degraded and was skipped")
+        started = time.monotonic()
+        try:
+            scraper_class = get_scraper_class(site)
+            if pool is not None:
+                # one lease per scrape; sessions and tokens that are bound to
+                # an address are cached per proxy by the scrapers themselves,
+                # so every scrape is free to take the best proxy
+                proxy = pool.acquire()
+            scraper = scraper_class(proxy=proxy)
+            scraper.quota = quota
+            scraped_data: JobResponse = scraper.scrape(scraper_input)
+        except BaseException as e:
+            breaker.record(False, str(e))
+            if pool is not None and isinstance(proxy, str):
+                pool.release(proxy, success=False)
+            raise
+    finally:
+        if quota is not None:
+            quota.finish(site.value)
+    elapsed = time.monotonic() - started
+    scraped_data.error = scraped_data.error or scraper.error
+    breaker.record(scraped_data.error is None, scraped_data.error)
+    if pool is not None:
+        pool.release(
+            proxy,
+            success=scraped_data.error is None,
+            latency=elapsed / max(scraper.pages_scraped, 1),
+        )
+    site_planner.record_scrape(
+        site.value,
+        scraper_input.search_term,
+        len(scraped_data.jobs),
+        scraper.pages_scraped,
+        elapsed,
+        scraped_data.error is not None,
+    )
+    cap_name = site.value.capitalize()
+    site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+    logger.info(f"{site_name} finished scraping")
+    return scraped_data
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
 
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
+def build_records(
+    site_to_jobs: dict[str, JobResponse],
+    hyperlinks: bool = False,
+    annual_currency: str = "USD",
+) -> list[dict]:
+    """
+    Flattens per-site responses into sorted result rows.
+    """
+    desired_order = get_desired_order(hyperlinks)
+    records = [
+        {column: job_data.get(column) for column in desired_order}
+        for site, job_response in site_to_jobs.items()
+        for job_data in (_job_to_dict(job, site) for job in job_response.jobs)
+    ]
+    annualize(records, annual_currency)
+    _sort_records(records)
+    return records
 
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["job_url_hyper"] = f'<a href="{job_url}">{job_url}</a>'
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-            else:
-                job_data["interval"] = None
-                job_data["min_amount"] = None
-                job_data["max_amount"] = None
-                job_data["currency"] = None
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Desired column order
-        desired_order = [
-            "site",
-            "job_url_hyper" if hyperlinks else "job_url",
-            "job_url_direct",
-            "title",
-            "company",
-            "location",
-            "job_type",
-            "date_posted",
-            "interval",
-            "min_amount",
-            "max_amount",
-            "currency",
-            "is_remote",
-            "emails",
-            "description",
-            "company_url",
-            "company_url_direct",
-            "company_addresses",
-            "company_industry",
-            "company_num_employees",
-            "company_revenue",
-            "company_description",
-            "logo_photo_url",
-            "banner_photo_url",
-            "ceo_name",
-            "ceo_photo_url",
-        ]
-
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
-
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
-
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(by=["site", "date_posted"], ascending=[True, False])
+
+def _job_to_dict(job, site: str) -> dict:
+    """
+    Flattens a JobPost into a single result row.
+    """
+    job_data = job.dict()
+    job_url = job_data["job_url"]
+    job_data["job_url_hyper"] = f'<a href="{job_url}">{job_url}</a>'
+    job_data["site"] = site
+    job_data["company"] = job_data["company_name"]
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+        if job_data["job_type"]
+        else None
+    )
+    job_data["emails"] = ", ".join(job_data["emails"]) if job_data["emails"] else None
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
+
+    compensation_obj = job_data.get("compensation")
+    if compensation_obj and isinstance(compensation_obj, dict):
+        job_data["interval"] = (
+            compensation_obj.get("interval").value
+            if compensation_obj.get("interval")
+            else None
+        )
+        job_data["min_amount"] = compensation_obj.get("min_amount")
+        job_data["max_amount"] = compensation_obj.get("max_amount")
+        job_data["currency"] = compensation_obj.get("currency", "USD")
     else:
-        return pd.DataFrame()
+        job_data["interval"] = None
+        job_data["min_amount"] = None
+        job_data["max_amount"] = None
+        job_data["currency"] = None
+    return job_data
+
+
+def _apply_quota(records: list[dict], total: int, min_per_site: int) -> list[dict]:
+    """
+    Keeps the newest min_per_site rows of every site, then the newest rows
+    overall up to total, in the original row order.
+    """
+    newest_first = sorted(
+        records,
+        key=lambda r: (r["date_posted"] is not None, r["date_posted"] or date.min),
+        reverse=True,
+    )
+    kept = set()
+    per_site: Counter = Counter()
+    for record in newest_first:
+        if per_site[record["site"]] < min_per_site:
+            per_site[record["site"]] += 1
+            kept.add(id(record))
+    for record in newest_first:
+        if len(kept) >= total:
+            break
+        kept.add(id(record))
+    return [record for record in records if id(record) in kept]
+
+
+def _sort_records(records: list[dict]) -> None:
+    """
+    Sorts rows by site, newest first within a site, undated rows last.
+    """
+    records.sort(
+        key=lambda r: (r["date_posted"] is not None, r["date_posted"] or date.min),
+        reverse=True,
+    )
+    records.sort(key=lambda r: r["site"])
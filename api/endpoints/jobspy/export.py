@@ -0,0 +1,172 @@
+"""
+jobspy.export
+~~~~~~~~~~~~~~~~~~~
+
+This module contains streaming exporters for scraped result sets: chunked
+CSV, Arrow IPC stream and Parquet. Rows are written in chunks and each
+chunk's bytes are yielded as soon as they are encoded, so memory use is
+bounded by chunk_size rather than by the size of the result set.
+"""
+
+from __future__ import annotations
+
+import io
+import csv
+from datetime import date
+from itertools import islice
+from typing import Iterable, Iterator
+
+from . import get_desired_order
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+FLOAT_COLUMNS = (
+    "min_amount",
+    "max_amount",
+    "annual_min_amount",
+    "annual_max_amount",
+)
+TYPED_COLUMNS = (*FLOAT_COLUMNS, "date_posted", "is_remote")
+
+
+class _ChunkSink:
+    """
+    Write-only file object that hands back whatever was written since the
+    last drain, so pyarrow writers can be streamed chunk by chunk.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _chunks(records: Iterable[dict], chunk_size: int) -> Iterator[list[dict]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def arrow_schema(columns: list[str]):
+    import pyarrow as pa
+
+    def column_type(column: str):
+        if column == "date_posted":
+            return pa.date32()
+        if column in FLOAT_COLUMNS:
+            return pa.float64()
+        if column == "is_remote":
+            return pa.bool_()
+        return pa.string()
+
+    return pa.schema([(column, column_type(column)) for column in columns])
+
+
+def _arrow_value(column: str, value):
+    if value is None or column in TYPED_COLUMNS or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def export_records(
+    records: Iterable[dict],
+    fmt: str,
+    columns: list[str] | None = None,
+    chunk_size: int = 1000,
+) -> Iterator[bytes]:
+    """
+    Streams result rows in the given format
+    :param records: rows from scrape_jobs(return_as="records") or a stored result set
+    :param fmt: one of EXPORT_FORMATS
+    :param columns: columns to write, defaults to the scrape_jobs column order
+    :return: iterator over encoded byte chunks
+    :raises ValueError: unknown format
+    :raises ImportError: pyarrow is missing for the arrow and parquet formats
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid export format: {fmt}")
+    columns = columns or get_desired_order()
+    if fmt == "csv":
+        return _export_csv(records, columns, chunk_size)
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(f"pyarrow is required to export {fmt}")
+    return _export_arrow(records, columns, chunk_size, parquet=fmt == "parquet")
+
+
+def _export_csv(
+    records: Iterable[dict], columns: list[str], chunk_size: int
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for chunk in _chunks(records, chunk_size):
+        writer.writerows(
+            {
+                key: value.isoformat() if isinstance(value, date) else value
+                for key, value in record.items()
+            }
+            for record in chunk
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _export_arrow(
+    records: Iterable[dict], columns: list[str], chunk_size: int, parquet: bool
+) -> Iterator[bytes]:
+    import pyarrow as pa
+
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    if parquet:
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    try:
+        for chunk in _chunks(records, chunk_size):
+            rows = [
+                {column: _arrow_value(column, record.get(column)) for column in columns}
+                for record in chunk
+            ]
+            # every chunk becomes one record batch / parquet row group
+            writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
@@ -256,3 +256,5 @@ class JobPost(BaseModel):
 
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
+    # why the site was degraded (blocked, failing or skipped), if it was
+    error: str | None = None
@@ -0,0 +1,277 @@
+"""
+jobspy.planner
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the cost-based site planner. It keeps running per-site,
+per-keyword-class statistics (jobs per page, page latency, error rate and
+duplicate rate against other sites) and uses them to decide which sites a
+search queries, how many pages each, and in what order.
+"""
+
+from __future__ import annotations
+
+import re
+import math
+import time
+from collections import Counter, deque
+from threading import Lock
+
+KEYWORD_CLASSES = {
+    "engineering": r"develop|engineer|programm|software|python|java|php|ruby|golang|rust|devops|sre|frontend|backend|full.?stack|data|machine learning|\bml\b|\bai\b|cloud|security|qa\b|test",
+    "design": r"design|\bux\b|\bui\b|product manag|creative",
+    "finance": r"account|financ|audit|bookkeep|payroll|tax|actuar|bank",
+    "healthcare": r"nurs|care|doctor|medical|clinic|pharma|dental|health|therap",
+    "education": r"teach|tutor|lectur|school|academ|education",
+    "sales": r"sales|marketing|business develop|account manag|recruit|seo",
+    "trades": r"electric|plumb|mechanic|driver|warehouse|construct|carpent|labour|technician",
+    "admin": r"admin|assistant|reception|secretar|office|customer service|support",
+}
+_CLASS_PATTERNS = [(name, re.compile(pattern)) for name, pattern in KEYWORD_CLASSES.items()]
+
+ALL_CLASSES = "*"
+# assumed until a site has history of its own
+PRIOR = {"jobs_per_page": 20.0, "page_latency": 3.0, "error_rate": 0.0, "duplicate_rate": 0.0}
+
+
+def keyword_class(search_term: str | None) -> str:
+    """
+    Coarse class of a search, e.g. "python developer" -> "engineering".
+    """
+    term = (search_term or "").lower()
+    for name, pattern in _CLASS_PATTERNS:
+        if pattern.search(term):
+            return name
+    return "general"
+
+
+class SiteStats:
+    def __init__(self, alpha: float = 0.2):
+        """
+        :param alpha: weight of the newest scrape in the moving averages
+        """
+        self.alpha = alpha
+        self.samples = 0
+        self.jobs_per_page: float | None = None
+        self.page_latency: float | None = None
+        self.error_rate = 0.0
+        self.duplicate_rate = 0.0
+
+    def _average(self, current: float | None, value: float) -> float:
+        if current is None:
+            return value
+        return current + self.alpha * (value - current)
+
+    def record_scrape(self, jobs: int, pages: int, seconds: float, failed: bool) -> None:
+        self.samples += 1
+        self.error_rate = self._average(self.error_rate if self.samples > 1 else None, float(failed))
+        if failed and not jobs:
+            # a blocked scrape says nothing about yield or speed
+            return
+        pages = max(pages, 1)
+        self.jobs_per_page = self._average(self.jobs_per_page, jobs / pages)
+        self.page_latency = self._average(self.page_latency, seconds / pages)
+
+    def record_duplicates(self, rate: float) -> None:
+        self.duplicate_rate = self._average(self.duplicate_rate, rate)
+
+    def snapshot(self) -> dict:
+        return {
+            "samples": self.samples,
+            "jobs_per_page": self.jobs_per_page,
+            "page_latency": self.page_latency,
+            "error_rate": self.error_rate,
+            "duplicate_rate": self.duplicate_rate,
+        }
+
+
+class SitePlanner:
+    def __init__(
+        self,
+        min_samples: int = 3,
+        max_error_rate: float = 0.8,
+        probe_interval: float = 60.0,
+        history: int = 50,
+    ):
+        """
+        :param min_samples: scrapes of a site/class before its own statistics
+            are trusted; until then the site's all-class statistics are used
+            and the site is always queried for one page to learn its yield
+        :param max_error_rate: sites failing more often than this are skipped
+        :param probe_interval: seconds between one-page probes of a site
+            skipped for its error rate, so its statistics can recover
+        :param history: recent plans and outcomes kept for inspection
+        """
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.probe_interval = probe_interval
+        self._stats: dict[tuple[str, str], SiteStats] = {}
+        # (site, keyword class) -> when it was last let through as a probe
+        self._probed: dict[tuple[str, str], float] = {}
+        self.history: deque[dict] = deque(maxlen=history)
+        self._lock = Lock()
+
+    def _get(self, site: str, klass: str) -> SiteStats:
+        stats = self._stats.get((site, klass))
+        if stats is None:
+            stats = self._stats[(site, klass)] = SiteStats()
+        return stats
+
+    def record_scrape(
+        self,
+        site: str,
+        search_term: str | None,
+        jobs: int,
+        pages: int,
+        seconds: float,
+        failed: bool,
+    ) -> None:
+        klass = keyword_class(search_term)
+        with self._lock:
+            for key in (klass, ALL_CLASSES):
+                self._get(site, key).record_scrape(jobs, pages, seconds, failed)
+
+    def record_duplicates(self, search_term: str | None, records: list[dict]) -> dict[str, float]:
+        """
+        Records, per site, the share of its jobs that another site also
+        returned (same title and company)
+        :return: duplicate rate by site
+        """
+        owners: dict[tuple, set] = {}
+        for record in records:
+            owners.setdefault(_job_key(record), set()).add(record["site"])
+        totals, duplicates = Counter(), Counter()
+        for record in records:
+            totals[record["site"]] += 1
+            if len(owners[_job_key(record)]) > 1:
+                duplicates[record["site"]] += 1
+        rates = {site: duplicates[site] / total for site, total in totals.items()}
+        if len(rates) < 2:
+            # nothing to overlap with
+            return rates
+        klass = keyword_class(search_term)
+        with self._lock:
+            for site, rate in rates.items():
+                for key in (klass, ALL_CLASSES):
+                    self._get(site, key).record_duplicates(rate)
+        return rates
+
+    def estimate(self, site: str, klass: str) -> dict:
+        with self._lock:
+            stats = self._stats.get((site, klass))
+            source = klass
+            if stats is None or stats.samples < self.min_samples:
+                stats, source = self._stats.get((site, ALL_CLASSES)), ALL_CLASSES
+            snapshot = stats.snapshot() if stats is not None else {"samples": 0}
+            class_samples = self._stats[(site, klass)].samples if (site, klass) in self._stats else 0
+        estimate = {
+            key: snapshot.get(key) if snapshot.get(key) is not None else prior
+            for key, prior in PRIOR.items()
+        }
+        estimate["effective_per_page"] = (
+            estimate["jobs_per_page"]
+            * (1 - estimate["duplicate_rate"])
+            * (1 - estimate["error_rate"])
+        )
+        estimate["score"] = estimate["effective_per_page"] / max(estimate["page_latency"], 0.1)
+        estimate["samples"] = class_samples
+        estimate["source"] = source if snapshot["samples"] else "prior"
+        return estimate
+
+    def plan(
+        self,
+        search_term: str | None,
+        sites: list[str],
+        results_wanted: int,
+        latency_target: float,
+    ) -> dict:
+        """
+        Picks sites and pages for a search. Sites run in parallel, so the
+        latency target caps the pages of each site rather than their sum.
+        Sites are ranked by unique jobs per second of page latency and
+        given pages until the expected unique jobs cover results_wanted.
+        :return: the plan, with a "sites" list in query order
+        """
+        klass = keyword_class(search_term)
+        ranked = sorted(
+            ((site, self.estimate(site, klass)) for site in sites),
+            key=lambda item: item[1]["score"],
+            reverse=True,
+        )
+        remaining = float(results_wanted)
+        planned, skipped = [], {}
+        for site, estimate in ranked:
+            learning = estimate["samples"] < self.min_samples
+            probe = False
+            if not learning and estimate["error_rate"] > self.max_error_rate:
+                if not self._probe_due(site, klass):
+                    skipped[site] = "error_rate"
+                    continue
+                probe = True
+            if not (learning or probe) and estimate["effective_per_page"] <= 0:
+                skipped[site] = "no_yield"
+                continue
+            if not (learning or probe) and remaining <= 0:
+                skipped[site] = "quota_covered"
+                continue
+            max_pages = max(1, int(latency_target // max(estimate["page_latency"], 0.1)))
+            if learning or probe:
+                pages = 1
+            else:
+                pages = min(max_pages, math.ceil(remaining / estimate["effective_per_page"]))
+            expected_jobs = pages * estimate["effective_per_page"]
+            remaining -= expected_jobs
+            planned.append(
+                {
+                    "site": site,
+                    "pages": pages,
+                    "results_wanted": max(1, math.ceil(pages * estimate["jobs_per_page"])),
+                    "expected_jobs": round(expected_jobs, 1),
+                    "expected_seconds": round(pages * estimate["page_latency"], 1),
+                    "learning": learning,
+                    "probe": probe,
+                    "estimate": estimate,
+                }
+            )
+        return {
+            "keyword_class": klass,
+            "results_wanted": results_wanted,
+            "latency_target": latency_target,
+            "expected_jobs": round(sum(entry["expected_jobs"] for entry in planned), 1),
+            "expected_seconds": max((entry["expected_seconds"] for entry in planned), default=0),
+            "sites": planned,
+            "skipped": skipped,
+            "created_at": time.time(),
+        }
+
+    def _probe_due(self, site: str, klass: str) -> bool:
+        """
+        Lets one search at a time per probe_interval through to a failing
+        site, as the circuit breaker's half-open probe does.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._probed.get((site, klass), -math.inf) < self.probe_interval:
+                return False
+            self._probed[(site, klass)] = now
+            return True
+
+    def record_outcome(self, plan: dict, outcome: dict) -> None:
+        with self._lock:
+            self.history.append({"plan": plan, "outcome": outcome})
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            stats: dict[str, dict] = {}
+            for (site, klass), site_stats in self._stats.items():
+                stats.setdefault(site, {})[klass] = site_stats.snapshot()
+            return {"stats": stats, "recent": list(self.history)}
+
+
+def _job_key(record: dict) -> tuple:
+    return (
+        (record.get("title") or "").strip().lower(),
+        (record.get("company") or "").strip().lower(),
+    )
+
+
+site_planner = SitePlanner()
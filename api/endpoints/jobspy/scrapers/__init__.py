@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import time
+from collections import Counter
+from threading import Event, Lock
+
+from .executors import SharedExecutor, get_executor
 from ..jobs import (
     Enum,
     BaseModel,
@@ -32,16 +37,97 @@ class ScraperInput(BaseModel):
     easy_apply: bool | None = None
     offset: int = 0
     linkedin_fetch_description: bool = False
+    linkedin_parallel_pages: bool = False
+    fetch_job_details: bool = False
     linkedin_company_ids: list[int] | None = None
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     results_wanted: int = 15
     hours_old: int | None = None
+    # output columns the caller needs, None for all of them
+    fields: frozenset[str] | None = None
+
+
+class ResultQuota:
+    """
+    Search-wide result quota shared by the scrapers of one scrape_jobs call.
+    Met once the sites together found `total` jobs and every site still
+    paginating found at least `min_per_site`; from then on scrapers stop after
+    their current page.
+    """
+
+    def __init__(self, total: int, min_per_site: int = 0):
+        self.total = total
+        self.min_per_site = min_per_site
+        self.counts: Counter = Counter()
+        self.active: set[str] = set()
+        self.stop = Event()
+        self._lock = Lock()
+
+    def start(self, site: str) -> None:
+        with self._lock:
+            self.active.add(site)
+            self.counts[site] += 0
+
+    def finish(self, site: str) -> None:
+        with self._lock:
+            self.active.discard(site)
+            self._check()
+
+    def add(self, site: str, jobs: int) -> bool:
+        """
+        Counts a scraped page
+        :return: whether the site should keep paginating
+        """
+        with self._lock:
+            self.counts[site] += jobs
+            self._check()
+        return not self.stop.is_set()
+
+    def _check(self) -> None:
+        if sum(self.counts.values()) >= self.total and all(
+            self.counts[site] >= self.min_per_site for site in self.active
+        ):
+            self.stop.set()
 
 
 class Scraper:
     def __init__(self, site: Site, proxy: list[str] | None = None):
         self.site = site
         self.proxy = (lambda p: {"http": p, "https": p} if p else None)(proxy)
+        # set when a search request fails (blocked, bad status, timeout), so
+        # the site's circuit breaker can tell a failure from an empty search
+        self.error: str | None = None
+        self.quota: ResultQuota | None = None
+        self.pages_scraped = 0
+        # page_scraped is called from pool threads by concurrent page fetches
+        self._pages_lock = Lock()
+        # long-lived pools shared by all scrapers, for request fan-out and
+        # for parsing; assign others to run a scraper on pools of its own
+        self.io_executor: SharedExecutor = get_executor("io")
+        self.parse_executor: SharedExecutor = get_executor("parse")
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def page_scraped(self, jobs: int) -> bool:
+        """
+        Pagination hook, called after each search results page
+        :param jobs: jobs found on the page
+        :return: False once the search-wide quota is met and no further
+            pages should be fetched
+        """
+        with self._pages_lock:
+            self.pages_scraped += 1
+        if self.quota is None:
+            return True
+        return self.quota.add(self.site.value, jobs)
+
+    def pause(self, seconds: float) -> bool:
+        """
+        Sleeps between pages, waking early once the quota is met
+        :return: False when no further pages should be fetched
+        """
+        if self.quota is None:
+            time.sleep(seconds)
+            return True
+        return not self.quota.stop.wait(seconds)
@@ -0,0 +1,156 @@
+"""
+jobspy.scrapers.breaker
+~~~~~~~~~~~~~~~~~~~
+
+This module contains per-site circuit breakers, so a board that is blocking
+or failing is skipped instantly instead of making every search wait on its
+retries and timeouts.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from threading import Lock
+
+from .utils import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        consecutive_failures: int = 3,
+        error_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 6,
+        reset_timeout: float = 60.0,
+        max_reset_timeout: float = 15 * 60.0,
+    ):
+        """
+        :param consecutive_failures: failures in a row that open the circuit
+        :param error_rate: failure ratio over the last `window` scrapes that
+            opens the circuit, once at least `min_calls` were recorded
+        :param reset_timeout: seconds the circuit stays open before a single
+            half-open probe scrape is let through
+        :param max_reset_timeout: cap for the open period, which doubles each
+            time a probe fails
+        """
+        self.name = name
+        self.consecutive_failures = consecutive_failures
+        self.error_rate = error_rate
+        self.min_calls = min_calls
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+
+        self.state = CLOSED
+        self.reset_timeout = reset_timeout
+        self.opened_at = 0.0
+        self.failures_in_row = 0
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.probing = False
+        self.skipped = 0
+        self.last_error: str | None = None
+        self._lock = Lock()
+
+    def allow(self) -> bool:
+        """
+        Whether a scrape may run now; in the half-open state only one probe
+        runs at a time and every other caller is skipped.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self.probing:
+                self.probing = True
+                logger.info(f"{self.name}: circuit half-open, probing")
+                return True
+            self.skipped += 1
+            return False
+
+    def record(self, success: bool, error: str | None = None) -> None:
+        with self._lock:
+            if not success:
+                self.last_error = error
+            if self.state == HALF_OPEN:
+                self.probing = False
+                if success:
+                    logger.info(f"{self.name}: probe succeeded, circuit closed")
+                    self._close()
+                else:
+                    self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                    self._open()
+                return
+            self.outcomes.append(success)
+            self.failures_in_row = 0 if success else self.failures_in_row + 1
+            if self.state == CLOSED and not success and self._should_open():
+                self._open()
+
+    def _should_open(self) -> bool:
+        if self.failures_in_row >= self.consecutive_failures:
+            return True
+        if len(self.outcomes) < self.min_calls:
+            return False
+        return self.outcomes.count(False) / len(self.outcomes) >= self.error_rate
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        logger.warning(
+            f"{self.name}: circuit open for {self.reset_timeout:.0f}s ({self.last_error})"
+        )
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self.reset_timeout = self.base_reset_timeout
+        self.failures_in_row = 0
+        self.outcomes.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures_in_row": self.failures_in_row,
+                "recent_error_rate": (
+                    self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+                ),
+                "reset_timeout": self.reset_timeout,
+                "skipped": self.skipped,
+                "last_error": self.last_error,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = Lock()
+
+
+def get_circuit_breaker(site: str) -> CircuitBreaker:
+    """
+    Process-wide breaker for a site, configured from the environment:
+    JOBSPY_BREAKER_FAILURES, JOBSPY_BREAKER_ERROR_RATE, JOBSPY_BREAKER_WINDOW
+    and JOBSPY_BREAKER_RESET (seconds)
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(site)
+        if breaker is None:
+            breaker = _breakers[site] = CircuitBreaker(
+                site,
+                consecutive_failures=int(os.getenv("JOBSPY_BREAKER_FAILURES", 3)),
+                error_rate=float(os.getenv("JOBSPY_BREAKER_ERROR_RATE", 0.5)),
+                window=int(os.getenv("JOBSPY_BREAKER_WINDOW", 20)),
+                reset_timeout=float(os.getenv("JOBSPY_BREAKER_RESET", 60)),
+            )
+        return breaker
+
+
+def circuit_breakers_snapshot() -> dict:
+    with _breakers_lock:
+        breakers = list(_breakers.items())
+    return {site: breaker.snapshot() for site, breaker in breakers}
@@ -11,7 +11,7 @@ import logging
 from concurrent.futures import ThreadPoolExecutor
 
 from .. import Scraper, ScraperInput, Site
-from ..utils import create_session, extract_emails_from_text
+from ..utils import create_session, analyze_text
 from ...jobs import (
     JobPost,
     Location,
@@ -75,6 +75,7 @@ class BuiltinScraper(Scraper):
             response = self.session.get(url, params=params)
             if response.status_code not in range(200, 400):
                 logger.error(f"Builtin: {response.status_code} {response.text}")
+                self.error = f"status code {response.status_code}"
                 return JobResponse(jobs=[])
             
             # Parse JSON-LD
@@ -106,6 +107,7 @@ class BuiltinScraper(Scraper):
 
         except Exception as e:
             logger.error(f"Builtin: {str(e)}")
+            self.error = str(e)
             
         return JobResponse(jobs=job_list)
 
@@ -123,6 +125,7 @@ class BuiltinScraper(Scraper):
         
         # Attempt to infer location? No location in JSON-LD.
         location = Location(city=None, country=None)
+        analysis = analyze_text(description, title)
         
         return JobPost(
             title=title,
@@ -130,5 +133,6 @@ class BuiltinScraper(Scraper):
             location=location,
             job_url=job_url,
             description=description,
-            emails=extract_emails_from_text(description),
+            emails=analysis.emails,
+            is_remote=analysis.remote,
         )
@@ -0,0 +1,276 @@
+"""
+jobspy.scrapers.cache
+~~~~~~~~~~~~~~~~~~~
+
+This module contains an on-disk HTTP response cache for job detail pages,
+which are effectively immutable once published.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+from threading import Lock
+from typing import Callable
+
+from .utils import logger
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "jobspy", "http-cache.sqlite3"
+)
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for a requests/tls_client response served from cache.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.from_cache = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise Exception(f"{self.status_code} Error for url: {self.url}")
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = 7 * 24 * 60 * 60,
+        max_bytes: int = 256 * 1024 * 1024,
+        flush_accessed: int = 256,
+    ):
+        """
+        :param path: sqlite database file
+        :param ttl: seconds a response stays fresh
+        :param max_bytes: cap on stored (compressed) bytes; least recently
+            used responses are evicted beyond it
+        :param flush_accessed: hits whose access times are buffered before
+            they are written back; they are also written before evicting
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.flush_accessed = flush_accessed
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._conn.commit()
+        self._lock = Lock()
+        # key -> last hit, not yet written to the accessed column
+        self._accessed: dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(method: str, url: str, params=None, data=None, json_body=None) -> str:
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="replace")
+        raw = json.dumps([method.upper(), url, params, data, json_body], default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        :return: the fresh cached response, None on a miss or when the
+            database can't be read
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT url, status, headers, body, created FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and now - row[4] <= self.ttl:
+                    self._accessed[key] = now
+                    if len(self._accessed) >= self.flush_accessed:
+                        self._write_accessed()
+                        self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"HTTP cache read failed: {e}")
+                row = None
+            if row is None or now - row[4] > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+        url, status, headers, body, _ = row
+        return CachedResponse(url, status, json.loads(headers), zlib.decompress(body))
+
+    def set(self, key: str, response) -> None:
+        content = response.content
+        if isinstance(content, str):
+            content = content.encode()
+        body = zlib.compress(content, 6)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    str(response.url),
+                    response.status_code,
+                    json.dumps(dict(response.headers or {})),
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._write_accessed()
+            self._evict(now)
+            self._conn.commit()
+
+    def _write_accessed(self) -> None:
+        accessed, self._accessed = self._accessed, {}
+        self._conn.executemany(
+            "UPDATE responses SET accessed = ? WHERE key = ?",
+            [(when, key) for key, when in accessed.items()],
+        )
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evict = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ):
+            if total <= self.max_bytes:
+                break
+            evict.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+
+class CachedSession:
+    """
+    Wraps a requests or tls_client session, serving GET/POST responses from the
+    cache and storing successful ones. Everything else is passed through.
+    """
+
+    def __init__(
+        self, session, cache: ResponseCache, cacheable: Callable[[object], bool] | None = None
+    ):
+        """
+        :param cacheable: further check on a 200 response before it is stored,
+            e.g. to reject login walls or error payloads served with a 200
+        """
+        self.session = session
+        self.cache = cache
+        self.cacheable = cacheable
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs):
+        key = self.cache.key(
+            method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        response = getattr(self.session, method.lower())(url, **kwargs)
+        if self._is_cacheable(url, response):
+            try:
+                self.cache.set(key, response)
+            except sqlite3.Error as e:
+                logger.warning(f"HTTP cache write failed: {e}")
+        return response
+
+    def _is_cacheable(self, url: str, response) -> bool:
+        if response.status_code != 200:
+            return False
+        # a redirect may have landed on a login wall or a different listing,
+        # which must not be served for the requested url
+        if getattr(response, "history", None):
+            return False
+        if str(response.url).split("?")[0] != url.split("?")[0]:
+            return False
+        return self.cacheable is None or self.cacheable(response)
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_lock = Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    Process-wide response cache, configured from the environment:
+    JOBSPY_HTTP_CACHE (set to 0 to disable), JOBSPY_HTTP_CACHE_PATH,
+    JOBSPY_HTTP_CACHE_TTL (seconds) and JOBSPY_HTTP_CACHE_MAX_MB
+    """
+    global _response_cache
+    if os.getenv("JOBSPY_HTTP_CACHE", "1") == "0":
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                _response_cache = ResponseCache(
+                    path=os.getenv("JOBSPY_HTTP_CACHE_PATH", DEFAULT_CACHE_PATH),
+                    ttl=float(os.getenv("JOBSPY_HTTP_CACHE_TTL", 7 * 24 * 60 * 60)),
+                    max_bytes=int(os.getenv("JOBSPY_HTTP_CACHE_MAX_MB", 256)) * 1024 * 1024,
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"HTTP cache disabled: {e}")
+                os.environ["JOBSPY_HTTP_CACHE"] = "0"
+                return None
+        return _response_cache
+
+
+def cached_session(session, cacheable: Callable[[object], bool] | None = None):
+    """
+    Wraps the session with the process-wide response cache, if enabled.
+    """
+    cache = get_response_cache()
+    return CachedSession(session, cache, cacheable) if cache else session
@@ -2,17 +2,28 @@ import requests
 from bs4 import BeautifulSoup
 from typing import Optional, List
 from datetime import datetime
+import math
 import re
+import threading
 
 from .. import Scraper, ScraperInput, Site
-from ..utils import create_session, logger
+from ..utils import analyze_text, create_session, fetch_pages_in_order, logger, RateLimiter
+from ..details import DetailEnricher
+from ..cache import cached_session
+from ..salary import parse_salary
 from ...jobs import (
     JobPost,
     Location,
     JobResponse,
 )
 
+# Shared by every scraper instance so concurrent searches stay polite
+detail_rate_limiter = RateLimiter(rate=5)
+
+
 class CVLibraryScraper(Scraper):
+    max_concurrent_pages = 4
+
     def __init__(self, proxy: Optional[str] = None):
         """
         Initializes CVLibraryScraper with the CV-Library search url
@@ -20,6 +31,7 @@ class CVLibraryScraper(Scraper):
         site = Site(Site.CV_LIBRARY)
         super().__init__(site, proxy=proxy)
         self.base_url = "https://www.cv-library.co.uk"
+        self._local = threading.local()
         
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -28,22 +40,14 @@ class CVLibraryScraper(Scraper):
         :return: JobResponse containing a list of jobs.
         """
         self.scraper_input = scraper_input
-        self.session = create_session(self.proxy)
-        # Add browser-like headers
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-        })
-
-        all_jobs: List[JobPost] = []
-        
+
         # Build URL
         # Pattern: https://www.cv-library.co.uk/{keyword}-jobs?us=1
         keyword = scraper_input.search_term or "jobs"
         keyword_slug = keyword.replace(" ", "-").lower()
-        search_path = f"/{keyword_slug}-jobs"
-        
-        params = {"us": "1"}
+        self.search_path = f"/{keyword_slug}-jobs"
+
+        self.params = {"us": "1"}
         if scraper_input.location:
              # CV-Library usually puts location in URL too, like /jobs/in-{location}?
              # But query params might work. Let's try standard query param 'location' or similar if supported, 
@@ -51,45 +55,95 @@ class CVLibraryScraper(Scraper):
              # Actually, simpler to just use q key if supported, but user specified format /{keyword}-jobs
              pass
 
-        page = 1
-        while len(all_jobs) < scraper_input.results_wanted:
-            try:
-                url = f"{self.base_url}{search_path}"
-                current_params = params.copy()
-                if page > 1:
-                    current_params["page"] = str(page)
-                
-                response = self.session.get(url, params=current_params)
-                if response.status_code != 200:
-                    logger.error(f"CV-Library status code: {response.status_code}")
-                    break
-                    
-                soup = BeautifulSoup(response.text, "html.parser")
-                job_listings = soup.select("article.job.search-card") 
-                
-                if not job_listings:
-                    break 
-                
-                for job_card in job_listings:
-                    if len(all_jobs) >= scraper_input.results_wanted:
-                        break
-                        
-                    job = self._process_job(job_card)
-                    if job:
-                        all_jobs.append(job)
-                        
-                # Check for next page
-                next_button = soup.select_one("ul.pagination li.next a")
-                if not next_button:
-                    break
-                page += 1
-                
-            except Exception as e:
-                logger.error(f"Error scraping CV-Library: {e}")
-                break
+        soup = self._get_page(1)
+        if soup is None:
+            return JobResponse(jobs=[])
+        job_listings = soup.select("article.job.search-card")
+        all_jobs: List[JobPost] = self._parse_listings(job_listings)
+        more_wanted = self.page_scraped(len(all_jobs))
+
+        next_button = soup.select_one("ul.pagination li.next a")
+        if job_listings and next_button and more_wanted and len(all_jobs) < scraper_input.results_wanted:
+            # Pages are addressed by ?page=n, so fetch the rest concurrently
+            pages_needed = math.ceil(scraper_input.results_wanted / len(job_listings))
+            for jobs in fetch_pages_in_order(
+                self._fetch_page,
+                range(2, pages_needed + 1),
+                self.max_concurrent_pages,
+                self.io_executor,
+            ):
+                all_jobs.extend(jobs)
 
+        all_jobs = all_jobs[: scraper_input.results_wanted]
+        if scraper_input.fetch_job_details:
+            all_jobs = DetailEnricher(
+                self._fetch_detail_page,
+                detail_rate_limiter,
+                executor=self.io_executor,
+                description_selectors=(".job__description", "#job-description", "[itemprop=description]"),
+            ).enrich(all_jobs, scraper_input.description_format)
         return JobResponse(jobs=all_jobs)
 
+    def _session(self):
+        """
+        One session per worker thread, with browser-like headers
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = create_session(self.proxy)
+            session.headers.update({
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+            })
+            self._local.session = session
+        return session
+
+    def _get_page(self, page: int) -> Optional[BeautifulSoup]:
+        url = f"{self.base_url}{self.search_path}"
+        current_params = self.params.copy()
+        if page > 1:
+            current_params["page"] = str(page)
+        try:
+            response = self._session().get(url, params=current_params)
+        except Exception as e:
+            logger.error(f"Error scraping CV-Library: {e}")
+            self.error = str(e)
+            return None
+        if response.status_code != 200:
+            # past the last page the site answers 404; that's the end of the
+            # results, not a failed search
+            if page == 1 or response.status_code in (403, 429):
+                logger.error(f"CV-Library status code: {response.status_code}")
+                self.error = f"status code {response.status_code}"
+            return None
+        return BeautifulSoup(response.text, "html.parser")
+
+    def _fetch_detail_page(self, job_url: str) -> Optional[str]:
+        response = cached_session(self._session()).get(job_url)
+        if response.status_code != 200:
+            logger.error(f"CV-Library detail page status code: {response.status_code}")
+            return None
+        return response.text
+
+    def _fetch_page(self, page: int) -> List[JobPost]:
+        if self.quota is not None and self.quota.stop.is_set():
+            # an empty page makes fetch_pages_in_order drop the later ones
+            return []
+        soup = self._get_page(page)
+        if soup is None:
+            return []
+        jobs = self._parse_listings(soup.select("article.job.search-card"))
+        self.page_scraped(len(jobs))
+        return jobs
+
+    def _parse_listings(self, job_listings) -> List[JobPost]:
+        jobs = []
+        for job_card in job_listings:
+            job = self._process_job(job_card)
+            if job:
+                jobs.append(job)
+        return jobs
+
     def _process_job(self, job_card) -> Optional[JobPost]:
         try:
             # Data attributes are a goldmine here
@@ -134,10 +188,7 @@ class CVLibraryScraper(Scraper):
             salary_text = job_card.get("data-job-salary")
             compensation = None
             if salary_text:
-                # We can try to parse it or just leave it for now if object requires strict parsing
-                # Scraper framework usually requires Compensation object parsing logic
-                # For now we won't implement strict parsing unless requested
-                pass
+                compensation = parse_salary(salary_text, default_currency="GBP")
 
             return JobPost(
                 title=title,
@@ -145,7 +196,9 @@ class CVLibraryScraper(Scraper):
                 job_url=job_url,
                 location=location_obj,
                 date_posted=date_posted,
-                description=None
+                compensation=compensation,
+                description=None,
+                is_remote=analyze_text(title, loc_text).remote,
             )
         except Exception as e:
             logger.error(f"Error processing CV-Library job: {e}")
@@ -0,0 +1,204 @@
+"""
+jobspy.scrapers.details
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the detail-page enrichment stage for scrapers whose
+search pages only carry job summaries.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from threading import Lock
+from typing import Callable
+
+from bs4 import BeautifulSoup
+from cachetools import TTLCache
+
+from .executors import SharedExecutor, get_executor
+from .utils import (
+    RateLimiter,
+    analyze_text,
+    get_enum_from_job_type,
+    markdown_converter,
+    logger,
+)
+from ..jobs import (
+    JobPost,
+    Compensation,
+    CompensationInterval,
+    DescriptionFormat,
+)
+
+# Detail pages rarely change once published, so parsed details are kept for a day
+_details_cache: TTLCache = TTLCache(maxsize=10000, ttl=24 * 60 * 60)
+_cache_lock = Lock()
+
+UNIT_TEXT_INTERVALS = {
+    "YEAR": CompensationInterval.YEARLY,
+    "MONTH": CompensationInterval.MONTHLY,
+    "WEEK": CompensationInterval.WEEKLY,
+    "DAY": CompensationInterval.DAILY,
+    "HOUR": CompensationInterval.HOURLY,
+}
+
+
+class DetailEnricher:
+    def __init__(
+        self,
+        fetch: Callable[[str], str | None],
+        rate_limiter: RateLimiter,
+        executor: SharedExecutor | None = None,
+        description_selectors: tuple[str, ...] = (),
+        max_workers: int = 4,
+    ):
+        """
+        :param fetch: returns the html of a job detail page, or None on failure
+        :param rate_limiter: limiter shared by every detail fetch for the site
+        :param executor: pool to fetch on, the shared "io" one by default
+        :param description_selectors: css selectors tried when the page has no
+            JobPosting structured data
+        :param max_workers: detail pages fetched at once
+        """
+        self.fetch = fetch
+        self.rate_limiter = rate_limiter
+        self.executor = executor or get_executor("io")
+        self.description_selectors = description_selectors
+        self.max_workers = max_workers
+
+    def enrich(
+        self, jobs: list[JobPost], description_format: DescriptionFormat | None
+    ) -> list[JobPost]:
+        """
+        Fills description, date posted, compensation and job type from each
+        job's detail page, fetching pages concurrently
+        """
+        if not jobs:
+            return jobs
+        details = self.executor.map(
+            self.get_details, [job.job_url for job in jobs], self.max_workers
+        )
+        for job, job_details in zip(jobs, details):
+            if job_details:
+                self.apply(job, job_details, description_format)
+        return jobs
+
+    def get_details(self, job_url: str) -> dict | None:
+        with _cache_lock:
+            cached = _details_cache.get(job_url)
+        if cached is not None:
+            return cached
+        self.rate_limiter.wait()
+        try:
+            html = self.fetch(job_url)
+            job_details = self.parse(html) if html else None
+        except Exception as e:
+            logger.error(f"Error fetching job details for {job_url}: {e}")
+            return None
+        if job_details:
+            with _cache_lock:
+                _details_cache[job_url] = job_details
+        return job_details
+
+    def parse(self, html: str) -> dict:
+        soup = BeautifulSoup(html, "html.parser")
+        posting = find_job_posting(soup) or {}
+        job_details = {
+            "description": posting.get("description"),
+            "date_posted": parse_date(posting.get("datePosted")),
+            "compensation": parse_base_salary(posting.get("baseSalary")),
+            "job_type": parse_employment_type(posting.get("employmentType")),
+        }
+        if not job_details["description"]:
+            for selector in self.description_selectors:
+                element = soup.select_one(selector)
+                if element:
+                    job_details["description"] = element.decode_contents().strip()
+                    break
+        return {k: v for k, v in job_details.items() if v}
+
+    @staticmethod
+    def apply(
+        job: JobPost, job_details: dict, description_format: DescriptionFormat | None
+    ) -> None:
+        description = job_details.get("description")
+        if description:
+            if description_format == DescriptionFormat.MARKDOWN:
+                description = markdown_converter(description)
+            job.description = description
+            analysis = analyze_text(description)
+            job.emails = analysis.emails
+            job.is_remote = job.is_remote or analysis.remote
+        if job_details.get("date_posted"):
+            job.date_posted = job_details["date_posted"]
+        if job_details.get("compensation") and not job.compensation:
+            job.compensation = job_details["compensation"]
+        if job_details.get("job_type") and not job.job_type:
+            job.job_type = job_details["job_type"]
+
+
+def find_job_posting(soup: BeautifulSoup) -> dict | None:
+    """
+    Finds the schema.org JobPosting in the page's JSON-LD, if any
+    """
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        candidates = data if isinstance(data, list) else [data]
+        if isinstance(data, dict) and "@graph" in data:
+            candidates = data["@graph"]
+        for item in candidates:
+            if isinstance(item, dict) and item.get("@type") == "JobPosting":
+                return item
+    return None
+
+
+def parse_date(value: str | None):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+def parse_base_salary(base_salary: dict | None) -> Compensation | None:
+    if not isinstance(base_salary, dict):
+        return None
+    value = base_salary.get("value")
+    if isinstance(value, dict):
+        min_amount = value.get("minValue", value.get("value"))
+        max_amount = value.get("maxValue", value.get("value"))
+        unit = value.get("unitText")
+    else:
+        min_amount = max_amount = value
+        unit = base_salary.get("unitText")
+    try:
+        min_amount = float(min_amount) if min_amount is not None else None
+        max_amount = float(max_amount) if max_amount is not None else None
+    except (TypeError, ValueError):
+        return None
+    if min_amount is None and max_amount is None:
+        return None
+    return Compensation(
+        interval=UNIT_TEXT_INTERVALS.get((unit or "").upper()),
+        min_amount=min_amount,
+        max_amount=max_amount,
+        currency=base_salary.get("currency") or "GBP",
+    )
+
+
+def parse_employment_type(employment_type) -> list | None:
+    if not employment_type:
+        return None
+    if isinstance(employment_type, str):
+        employment_type = [employment_type]
+    job_types = []
+    for value in employment_type:
+        job_type = get_enum_from_job_type(value.replace("_", "").replace("-", "").lower())
+        if job_type and job_type not in job_types:
+            job_types.append(job_type)
+    return job_types or None
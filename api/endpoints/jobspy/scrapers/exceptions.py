@@ -29,3 +29,8 @@ class GlassdoorException(Exception):
 class BuiltinException(Exception):
     def __init__(self, message=None):
         super().__init__(message or "An error occurred with Builtin")
+
+
+class CircuitOpenException(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "Site skipped after repeated failures")
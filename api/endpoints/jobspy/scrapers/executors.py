@@ -0,0 +1,191 @@
+"""
+jobspy.scrapers.executors
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the long-lived, named thread pools shared by every
+search: "io" for request fan-out (sites, pages, detail fetches), "parse" for
+turning responses into job posts and "hedge" for hedged request attempts.
+Waiting on a task that no worker has picked up yet runs it on the waiting
+thread, so tasks that fan out into the pool they run on can't deadlock it.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from threading import Lock
+from typing import Callable, Iterable, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _CallerRunsFuture(Future):
+    """
+    Future of a SharedExecutor task, run by whichever comes first: a pool
+    worker, or a thread asking for its result.
+    """
+
+    def __init__(self, pool: SharedExecutor, fn: Callable, args: tuple, kwargs: dict):
+        super().__init__()
+        self._pool = pool
+        self._call = (fn, args, kwargs)
+        self._claimed = False
+        self._claim_lock = Lock()
+
+    def _claim(self) -> bool:
+        with self._claim_lock:
+            if self._claimed:
+                return False
+            self._claimed = True
+        self._pool._dequeued()
+        return self.set_running_or_notify_cancel()
+
+    def run(self, inline: bool = False) -> None:
+        if not self._claim():
+            return
+        fn, args, kwargs = self._call
+        self._call = None
+        self._pool._started(inline)
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._pool._finished(inline, failed=True)
+            self.set_exception(e)
+        else:
+            self._pool._finished(inline, failed=False)
+            self.set_result(result)
+
+    def cancel(self) -> bool:
+        with self._claim_lock:
+            if self._claimed or not super().cancel():
+                return False
+            self._claimed = True
+        self._pool._dequeued(cancelled=True)
+        # wakes futures.wait() and as_completed() callers
+        self.set_running_or_notify_cancel()
+        return True
+
+    def result(self, timeout: float | None = None):
+        self.run(inline=True)
+        return super().result(timeout)
+
+    def exception(self, timeout: float | None = None):
+        self.run(inline=True)
+        return super().exception(timeout)
+
+
+class SharedExecutor:
+    def __init__(self, name: str, max_workers: int):
+        """
+        :param name: pool name, also the prefix of its thread names
+        :param max_workers: threads in the pool; tasks beyond that queue
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"jobspy-{name}"
+        )
+        self._lock = Lock()
+        self.queued = 0
+        self.running = 0
+        self.running_inline = 0
+        self.counters: Counter = Counter()
+
+    def submit(self, fn: Callable[..., R], *args, **kwargs) -> Future:
+        future = _CallerRunsFuture(self, fn, args, kwargs)
+        with self._lock:
+            self.queued += 1
+            self.counters["submitted"] += 1
+        self._executor.submit(future.run)
+        return future
+
+    def map(
+        self, fn: Callable[[T], R], items: Iterable[T], max_in_flight: int | None = None
+    ) -> list[R]:
+        """
+        Runs fn over items with at most max_in_flight of them submitted at
+        once, waiting in item order
+        :return: results in item order
+        :raises: the first exception raised by fn, in item order; tasks not
+            started by then are cancelled
+        """
+        items = list(items)
+        window = max_in_flight or len(items)
+        futures = [self.submit(fn, item) for item in items[:window]]
+        results = []
+        try:
+            for i in range(len(items)):
+                results.append(futures[i].result())
+                if i + window < len(items):
+                    futures.append(self.submit(fn, items[i + window]))
+        finally:
+            for future in futures:
+                future.cancel()
+        return results
+
+    def _dequeued(self, cancelled: bool = False) -> None:
+        with self._lock:
+            self.queued -= 1
+            if cancelled:
+                self.counters["cancelled"] += 1
+
+    def _started(self, inline: bool) -> None:
+        with self._lock:
+            if inline:
+                self.running_inline += 1
+                self.counters["ran_inline"] += 1
+            else:
+                self.running += 1
+
+    def _finished(self, inline: bool, failed: bool) -> None:
+        with self._lock:
+            if inline:
+                self.running_inline -= 1
+            else:
+                self.running -= 1
+            self.counters["failed" if failed else "completed"] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self.running,
+                "running_inline": self.running_inline,
+                "queued": self.queued,
+                "utilization": round(self.running / self.max_workers, 3),
+                **self.counters,
+            }
+
+
+# name -> (environment variable, default size)
+EXECUTOR_SIZES = {
+    "io": ("JOBSPY_IO_WORKERS", 64),
+    "parse": ("JOBSPY_PARSE_WORKERS", min(32, (os.cpu_count() or 1) + 4)),
+    "hedge": ("JOBSPY_HEDGE_WORKERS", 16),
+}
+_executors: dict[str, SharedExecutor] = {}
+_executors_lock = Lock()
+
+
+def get_executor(name: str) -> SharedExecutor:
+    """
+    Process-wide executor by name (one of EXECUTOR_SIZES), sized from the
+    environment: JOBSPY_IO_WORKERS, JOBSPY_PARSE_WORKERS and
+    JOBSPY_HEDGE_WORKERS
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            env, default = EXECUTOR_SIZES[name]
+            executor = _executors[name] = SharedExecutor(
+                name, max_workers=int(os.getenv(env, default))
+            )
+        return executor
+
+
+def executors_snapshot() -> dict:
+    with _executors_lock:
+        executors = list(_executors.items())
+    return {name: executor.snapshot() for name, executor in executors}
@@ -10,22 +10,24 @@ from __future__ import annotations
 import re
 import json
 import requests
+from threading import Lock
 from typing import Optional, Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from cachetools import TTLCache, LRUCache
 
 from .. import Scraper, ScraperInput, Site
-from ..utils import extract_emails_from_text
+from ..utils import analyze_text
 from ..exceptions import GlassdoorException
 from ..utils import (
     create_session,
     markdown_converter,
     logger,
 )
+from ..salary import normalize_interval
 from ...jobs import (
     JobPost,
     Compensation,
-    CompensationInterval,
     Location,
     JobResponse,
     JobType,
@@ -33,6 +35,33 @@ from ...jobs import (
 )
 
 
+# Shared across scraper instances so steady-state searches skip the token page
+# and the location lookup. Tokens are keyed by (base_url, proxy) since they
+# are tied to the session that fetched them.
+_csrf_tokens: TTLCache = TTLCache(maxsize=64, ttl=30 * 60)
+_locations: LRUCache = LRUCache(maxsize=1024)
+# raw description html by (base_url, listing id); listings are re-served on
+# every later page and search they match
+_descriptions: TTLCache = TTLCache(maxsize=4096, ttl=6 * 60 * 60)
+_cache_lock = Lock()
+
+# output columns derived from the description
+DESCRIPTION_FIELDS = {"description", "emails", "is_remote"}
+
+
+def _is_graph_success(response) -> bool:
+    """
+    Whether a batched graph response is worth caching; GraphQL reports
+    failures as an "errors" payload with a 200
+    """
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    items = data if isinstance(data, list) else [data]
+    return all(isinstance(item, dict) and not item.get("errors") for item in items)
+
+
 class GlassdoorScraper(Scraper):
     def __init__(self, proxy: Optional[str] = None):
         """
@@ -44,9 +73,12 @@ class GlassdoorScraper(Scraper):
         self.base_url = None
         self.country = None
         self.session = None
+        self.detail_session = None
         self.scraper_input = None
         self.jobs_per_page = 30
         self.max_pages = 30
+        self.description_batch_size = 10
+        self.description_workers = 3
         self.seen_urls = set()
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
@@ -60,14 +92,18 @@ class GlassdoorScraper(Scraper):
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
         self.session = create_session(self.proxy, is_tls=True, has_retry=True)
-        token = self._get_csrf_token()
-        self.headers["gd-csrf-token"] = token if token else self.fallback_token
+        self.detail_session = create_session(
+            self.proxy, is_tls=False, cache=True, cacheable=_is_graph_success
+        )
+        self.headers = self.headers.copy()
+        self.headers["gd-csrf-token"] = self._get_cached_csrf_token()
 
         location_id, location_type = self._get_location(
             scraper_input.location, scraper_input.is_remote
         )
         if location_type is None:
             logger.error("Glassdoor: location not parsed")
+            self.error = "location not parsed"
             return JobResponse(jobs=[])
         all_jobs: list[JobPost] = []
         cursor = None
@@ -85,8 +121,11 @@ class GlassdoorScraper(Scraper):
                 if not jobs or len(all_jobs) >= scraper_input.results_wanted:
                     all_jobs = all_jobs[: scraper_input.results_wanted]
                     break
+                if not self.page_scraped(len(jobs)):
+                    break
             except Exception as e:
                 logger.error(f"Glassdoor: {str(e)}")
+                self.error = str(e)
                 break
         return JobResponse(jobs=all_jobs)
 
@@ -105,12 +144,11 @@ class GlassdoorScraper(Scraper):
         self.scraper_input = scraper_input
         try:
             payload = self._add_payload(location_id, location_type, page_num, cursor)
-            response = self.session.post(
-                f"{self.base_url}/graph",
-                headers=self.headers,
-                timeout_seconds=15,
-                data=payload,
-            )
+            response = self._post_graph(payload)
+            if response.status_code in (401, 403):
+                logger.info("Glassdoor: csrf token rejected, refreshing")
+                self.headers["gd-csrf-token"] = self._get_cached_csrf_token(refresh=True)
+                response = self._post_graph(payload)
             if response.status_code != 200:
                 exc_msg = f"bad response status code: {response.status_code}"
                 raise GlassdoorException(exc_msg)
@@ -124,26 +162,61 @@ class GlassdoorScraper(Scraper):
             Exception,
         ) as e:
             logger.error(f"Glassdoor: {str(e)}")
+            self.error = str(e)
             return jobs, None
 
-        jobs_data = res_json["data"]["jobListings"]["jobListings"]
-
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        jobs_data = [
+            job
+            for job in res_json["data"]["jobListings"]["jobListings"]
+            if self._job_url(job) not in self.seen_urls
+        ]
+        # listings past results_wanted are cut by scrape(), don't fetch them
+        jobs_data = jobs_data[: max(0, scraper_input.results_wanted - len(self.seen_urls))]
+        fields = self.scraper_input.fields
+        descriptions = {}
+        if fields is None or fields & DESCRIPTION_FIELDS:
+            descriptions = self._fetch_descriptions(
+                [job["jobview"]["job"]["listingId"] for job in jobs_data]
+            )
+        for job in jobs_data:
+            try:
+                job_post = self._process_job(job, descriptions)
+            except Exception as exc:
+                raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+            if job_post:
+                jobs.append(job_post)
 
         return jobs, self.get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
         )
 
+    def _post_graph(self, payload: str):
+        return self.session.post(
+            f"{self.base_url}/graph",
+            headers=self.headers,
+            timeout_seconds=15,
+            data=payload,
+        )
+
+    def _get_cached_csrf_token(self, refresh: bool = False) -> str:
+        """
+        Returns the shared csrf token for this domain/proxy, fetching a new one
+        when missing, expired or after the API rejected the cached one
+        """
+        key = (self.base_url, str(self.proxy))
+        with _cache_lock:
+            if refresh:
+                _csrf_tokens.pop(key, None)
+            token = _csrf_tokens.get(key)
+        if token:
+            return token
+        token = self._get_csrf_token()
+        if not token:
+            return self.fallback_token
+        with _cache_lock:
+            _csrf_tokens[key] = token
+        return token
+
     def _get_csrf_token(self):
         """
         Fetches csrf token needed for API by visiting a generic page
@@ -158,12 +231,16 @@ class GlassdoorScraper(Scraper):
             token = matches[0]
         return token
 
-    def _process_job(self, job_data):
+    def _job_url(self, job_data: dict) -> str:
+        return f"{self.base_url}job-listing/j?jl={job_data['jobview']['job']['listingId']}"
+
+    def _process_job(self, job_data: dict, descriptions: dict[int, str | None]):
         """
-        Processes a single job and fetches its description.
+        Processes a single job
+        :param descriptions: description html by listing id
         """
         job_id = job_data["jobview"]["job"]["listingId"]
-        job_url = f"{self.base_url}job-listing/j?jl={job_id}"
+        job_url = self._job_url(job_data)
         if job_url in self.seen_urls:
             return None
         self.seen_urls.add(job_url)
@@ -184,11 +261,11 @@ class GlassdoorScraper(Scraper):
             location = self.parse_location(location_name)
 
         compensation = self.parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
+        description = descriptions.get(job_id)
+        if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            description = markdown_converter(description)
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
+        analysis = analyze_text(description, title, location_name)
         return JobPost(
             title=title,
             company_url=company_url if company_id else None,
@@ -197,16 +274,60 @@ class GlassdoorScraper(Scraper):
             job_url=job_url,
             location=location,
             compensation=compensation,
-            is_remote=is_remote,
+            is_remote=is_remote or analysis.remote,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=analysis.emails,
         )
 
-    def _fetch_job_description(self, job_id):
+    def _fetch_descriptions(self, job_ids: list[int]) -> dict[int, str | None]:
+        """
+        Description html by listing id, from the shared cache or fetched
+        description_batch_size listings per request, a few requests at a time
+        """
+        descriptions, missing = {}, []
+        with _cache_lock:
+            for job_id in job_ids:
+                description = _descriptions.get((self.base_url, job_id))
+                if description is None:
+                    missing.append(job_id)
+                else:
+                    descriptions[job_id] = description
+        size = self.description_batch_size
+        batches = [missing[i : i + size] for i in range(0, len(missing), size)]
+        for fetched in self.io_executor.map(
+            self._fetch_description_batch, batches, self.description_workers
+        ):
+            descriptions.update(fetched)
+        return descriptions
+
+    def _fetch_description_batch(self, job_ids: list[int]) -> dict[int, str | None]:
+        try:
+            fetched = self._post_job_details(job_ids)
+        except Exception as e:
+            logger.warning(f"Glassdoor: job details failed: {e}")
+            return {}
+        if fetched is None:
+            # the batch wasn't understood; fall back to one listing per request
+            logger.info("Glassdoor: batched job details rejected, fetching singly")
+            fetched = {}
+            for job_id in job_ids:
+                try:
+                    fetched.update(self._post_job_details([job_id]) or {})
+                except Exception:
+                    continue
+        with _cache_lock:
+            for job_id, description in fetched.items():
+                if description:
+                    _descriptions[(self.base_url, job_id)] = description
+        return fetched
+
+    def _post_job_details(self, job_ids: list[int]) -> dict[int, str | None] | None:
         """
-        Fetches the job description for a single job ID.
+        Fetches descriptions with one JobDetailQuery operation per listing in
+        a single batched request
+        :return: description by listing id, {} when the request failed, None
+            when the response doesn't match the batch
         """
-        url = f"{self.base_url}/graph"
         body = [
             {
                 "operationName": "JobDetailQuery",
@@ -215,36 +336,40 @@ class GlassdoorScraper(Scraper):
                     "queryString": "q",
                     "pageTypeEnum": "SERP",
                 },
-                "query": """
-                query JobDetailQuery($jl: Long!, $queryString: String, $pageTypeEnum: PageTypeEnum) {
-                    jobview: jobView(
-                        listingId: $jl
-                        contextHolder: {queryString: $queryString, pageTypeEnum: $pageTypeEnum}
-                    ) {
-                        job {
-                            description
-                            __typename
-                        }
-                        __typename
-                    }
-                }
-                """,
+                "query": self.job_detail_query,
             }
+            for job_id in job_ids
         ]
-        res = requests.post(url, json=body, headers=self.headers)
+        res = self.detail_session.post(
+            f"{self.base_url}/graph", json=body, headers=self.headers
+        )
         if res.status_code != 200:
+            return {}
+        data = res.json()
+        if not isinstance(data, list) or len(data) != len(job_ids):
             return None
-        data = res.json()[0]
-        desc = data["data"]["jobview"]["job"]["description"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            desc = markdown_converter(desc)
-        return desc
+        descriptions = {}
+        for job_id, item in zip(job_ids, data):
+            jobview = (item.get("data") or {}).get("jobview") or {}
+            descriptions[job_id] = (jobview.get("job") or {}).get("description")
+        return descriptions
 
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
         if not location or is_remote:
             return "11047", "STATE"  # remote options
+        key = (self.base_url, location.strip().lower())
+        with _cache_lock:
+            cached = _locations.get(key)
+        if cached:
+            return cached
+        location_id, location_type = self._fetch_location(location)
+        if location_type is not None:
+            with _cache_lock:
+                _locations[key] = (location_id, location_type)
+        return location_id, location_type
+
+    def _fetch_location(self, location: str) -> (int, str):
         url = f"{self.base_url}/findPopularLocationAjax.htm?maxLocationsToReturn=10&term={location}"
-        session = create_session(self.proxy, has_retry=True)
         res = self.session.get(url, headers=self.headers)
         if res.status_code != 200:
             if res.status_code == 429:
@@ -315,11 +440,7 @@ class GlassdoorScraper(Scraper):
         if not pay_period or not adjusted_pay:
             return None
 
-        interval = None
-        if pay_period == "ANNUAL":
-            interval = CompensationInterval.YEARLY
-        elif pay_period:
-            interval = CompensationInterval.get_interval(pay_period)
+        interval = normalize_interval(pay_period)
         min_amount = int(adjusted_pay.get("p10") // 1)
         max_amount = int(adjusted_pay.get("p90") // 1)
         return Compensation(
@@ -366,6 +487,20 @@ class GlassdoorScraper(Scraper):
         "sec-fetch-site": "same-origin",
         "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
     }
+    job_detail_query = """
+        query JobDetailQuery($jl: Long!, $queryString: String, $pageTypeEnum: PageTypeEnum) {
+            jobview: jobView(
+                listingId: $jl
+                contextHolder: {queryString: $queryString, pageTypeEnum: $pageTypeEnum}
+            ) {
+                job {
+                    description
+                    __typename
+                }
+                __typename
+            }
+        }
+    """
     query_template = """
             query JobSearchResultsQuery(
                 $excludeJobListingIds: [Long!], 
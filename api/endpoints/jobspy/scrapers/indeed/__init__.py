@@ -9,28 +9,124 @@ from __future__ import annotations
 
 import math
 from typing import Tuple
+from functools import lru_cache
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, Future
 
 import requests
 
 from .. import Scraper, ScraperInput, Site
 from ..utils import (
-    extract_emails_from_text,
+    analyze_text,
     get_enum_from_job_type,
     markdown_converter,
+    get_hedger,
     logger,
 )
+from ..salary import normalize_interval
 from ...jobs import (
     JobPost,
     Compensation,
-    CompensationInterval,
     Location,
     JobResponse,
     JobType,
     DescriptionFormat,
 )
 
+# GraphQL blocks fetched for each output column; key, title and the dates are
+# always fetched. Columns missing here need nothing beyond those.
+FIELD_BLOCKS = {
+    "job_url_direct": {"recruit"},
+    "company": {"employer"},
+    "company_url": {"employer"},
+    "company_url_direct": {"employer", "links"},
+    **{
+        field: {"employer", "employer_details"}
+        for field in (
+            "company_addresses",
+            "company_industry",
+            "company_num_employees",
+            "company_revenue",
+            "company_description",
+            "ceo_name",
+            "ceo_photo_url",
+        )
+    },
+    "logo_photo_url": {"employer", "images"},
+    "banner_photo_url": {"employer", "images"},
+    "location": {"location"},
+    "job_type": {"attributes"},
+    **{
+        field: {"compensation"}
+        for field in (
+            "interval",
+            "min_amount",
+            "max_amount",
+            "currency",
+            "annual_min_amount",
+            "annual_max_amount",
+            "annual_currency",
+        )
+    },
+    "is_remote": {"description", "location", "attributes"},
+    "emails": {"description"},
+    "description": {"description"},
+}
+JOB_BLOCKS = {
+    "description": "description { html }",
+    "location": """location {
+      countryName
+      countryCode
+      admin1Code
+      city
+      postalCode
+      streetAddress
+      formatted { short long }
+    }""",
+    "compensation": """compensation {
+      baseSalary {
+        unitOfWork
+        range { ... on Range { min max } }
+      }
+      currencyCode
+    }""",
+    "attributes": "attributes { key label }",
+    "recruit": "recruit { viewJobUrl detailedSalary workSchedule }",
+}
+DOSSIER_BLOCKS = {
+    "employer_details": """employerDetails {
+      addresses
+      industry
+      employeesLocalizedLabel
+      revenueLocalizedLabel
+      briefDescription
+      ceoName
+      ceoPhotoUrl
+    }""",
+    "images": "images { headerImageUrl squareLogoUrl }",
+    "links": "links { corporateWebsite }",
+}
+
+
+@lru_cache(maxsize=64)
+def job_selection(fields: frozenset[str] | None) -> str:
+    """
+    GraphQL selection of a search result's job for the given output columns
+    :param fields: output columns, None for all of them
+    """
+    if fields is None:
+        blocks = {*JOB_BLOCKS, "employer", *DOSSIER_BLOCKS}
+    else:
+        blocks = set().union(*(FIELD_BLOCKS.get(field, ()) for field in fields))
+    selection = ["key", "title", "datePublished", "dateOnIndeed"]
+    selection += [block for name, block in JOB_BLOCKS.items() if name in blocks]
+    if "employer" in blocks:
+        employer = ["relativeCompanyPageUrl", "name"]
+        dossier = [block for name, block in DOSSIER_BLOCKS.items() if name in blocks]
+        if dossier:
+            employer.append(f"dossier {{ {' '.join(dossier)} }}")
+        selection.append(f"employer {{ {' '.join(employer)} }}")
+    return "\n".join(selection)
+
 
 class IndeedScraper(Scraper):
     def __init__(self, proxy: str | None = None):
@@ -73,18 +169,24 @@ class IndeedScraper(Scraper):
 
         while len(self.seen_urls) < scraper_input.results_wanted:
             logger.info(f"Indeed search page: {page}")
-            jobs, cursor = self._scrape_page(cursor)
+            remaining = scraper_input.results_wanted - len(self.seen_urls)
+            jobs, cursor = self._scrape_page(cursor, min(remaining, self.jobs_per_page))
             if not jobs:
                 logger.info(f"Indeed found no jobs on page: {page}")
                 break
             job_list += jobs
             page += 1
+            if not self.page_scraped(len(jobs)):
+                break
         return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _scrape_page(
+        self, cursor: str | None, limit: int = 100
+    ) -> Tuple[list[JobPost], str | None]:
         """
         Scrapes a page of Indeed for jobs with scraper_input criteria
         :param cursor:
+        :param limit: jobs to request
         :return: jobs found on page, next page cursor
         """
         jobs = []
@@ -104,33 +206,38 @@ class IndeedScraper(Scraper):
             dateOnIndeed=self.scraper_input.hours_old,
             cursor=f'cursor: "{cursor}"' if cursor else "",
             filters=filters,
+            limit=limit,
+            job=job_selection(self.scraper_input.fields),
         )
         payload = {
             "query": query,
         }
         api_headers = self.api_headers.copy()
         api_headers["indeed-co"] = self.api_country_code
-        response = requests.post(
-            self.api_url,
-            headers=api_headers,
-            json=payload,
-            proxies=self.proxy,
-            timeout=10,
+        # a search query is idempotent, so a slow answer can be hedged
+        response = get_hedger("indeed").request(
+            lambda: requests.post(
+                self.api_url,
+                headers=api_headers,
+                json=payload,
+                proxies=self.proxy,
+                timeout=10,
+            )
         )
         if response.status_code != 200:
             logger.info(
                 f"Indeed responded with status code: {response.status_code} (submit GitHub issue if this appears to be a beg)"
             )
+            self.error = f"status code {response.status_code}"
             return jobs, new_cursor
         data = response.json()
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
 
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            job_results: list[Future] = [
-                executor.submit(self._process_job, job["job"]) for job in jobs
-            ]
-        job_list = [result.result() for result in job_results if result.result()]
+        job_results = self.parse_executor.map(
+            self._process_job, [job["job"] for job in jobs], self.num_workers
+        )
+        job_list = [job_post for job_post in job_results if job_post]
         return job_list, new_cursor
 
     def _build_filters(self):
@@ -201,28 +308,38 @@ class IndeedScraper(Scraper):
         if job_url in self.seen_urls:
             return
         self.seen_urls.add(job_url)
-        description = job["description"]["html"]
+        # blocks the query left out for unrequested fields are missing here
+        description = (job.get("description") or {}).get("html")
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             description = markdown_converter(description)
 
-        job_type = self._get_job_type(job["attributes"])
+        attributes = job.get("attributes") or []
+        job_location = job.get("location") or {}
+        job_type = self._get_job_type(attributes)
         timestamp_seconds = job["datePublished"] / 1000
         date_posted = datetime.fromtimestamp(timestamp_seconds).strftime("%Y-%m-%d")
-        employer = job["employer"].get("dossier") if job["employer"] else None
-        employer_details = employer.get("employerDetails", {}) if employer else {}
-        rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
+        employer = job["employer"].get("dossier") if job.get("employer") else None
+        employer_details = (employer.get("employerDetails") or {}) if employer else {}
+        rel_url = job["employer"]["relativeCompanyPageUrl"] if job.get("employer") else None
+        analysis = analyze_text(
+            description,
+            (job_location.get("formatted") or {}).get("long"),
+            *(attr["label"] for attr in attributes),
+        )
         return JobPost(
             title=job["title"],
             description=description,
             company_name=job["employer"].get("name") if job.get("employer") else None,
-            company_url=(f"{self.base_url}{rel_url}" if job["employer"] else None),
+            company_url=(f"{self.base_url}{rel_url}" if job.get("employer") else None),
             company_url_direct=(
-                employer["links"]["corporateWebsite"] if employer else None
+                employer["links"]["corporateWebsite"]
+                if employer and employer.get("links")
+                else None
             ),
             location=Location(
-                city=job.get("location", {}).get("city"),
-                state=job.get("location", {}).get("admin1Code"),
-                country=job.get("location", {}).get("countryCode"),
+                city=job_location.get("city"),
+                state=job_location.get("admin1Code"),
+                country=job_location.get("countryCode"),
             ),
             job_type=job_type,
             compensation=self._get_compensation(job),
@@ -231,8 +348,8 @@ class IndeedScraper(Scraper):
             job_url_direct=(
                 job["recruit"].get("viewJobUrl") if job.get("recruit") else None
             ),
-            emails=extract_emails_from_text(description) if description else None,
-            is_remote=self._is_job_remote(job, description),
+            emails=analysis.emails,
+            is_remote=analysis.remote,
             company_addresses=(
                 employer_details["addresses"][0]
                 if employer_details.get("addresses")
@@ -286,10 +403,10 @@ class IndeedScraper(Scraper):
         :param job:
         :return: compensation object
         """
-        comp = job["compensation"]["baseSalary"]
+        comp = job["compensation"]["baseSalary"] if job.get("compensation") else None
         if not comp:
             return None
-        interval = IndeedScraper._get_compensation_interval(comp["unitOfWork"])
+        interval = normalize_interval(comp["unitOfWork"])
         if not interval:
             return None
         min_range = comp["range"].get("min")
@@ -301,42 +418,6 @@ class IndeedScraper(Scraper):
             currency=job["compensation"]["currencyCode"],
         )
 
-    @staticmethod
-    def _is_job_remote(job: dict, description: str) -> bool:
-        """
-        Searches the description, location, and attributes to check if job is remote
-        """
-        remote_keywords = ["remote", "work from home", "wfh"]
-        is_remote_in_attributes = any(
-            any(keyword in attr["label"].lower() for keyword in remote_keywords)
-            for attr in job["attributes"]
-        )
-        is_remote_in_description = any(
-            keyword in description.lower() for keyword in remote_keywords
-        )
-        is_remote_in_location = any(
-            keyword in job["location"]["formatted"]["long"].lower()
-            for keyword in remote_keywords
-        )
-        return (
-            is_remote_in_attributes or is_remote_in_description or is_remote_in_location
-        )
-
-    @staticmethod
-    def _get_compensation_interval(interval: str) -> CompensationInterval:
-        interval_mapping = {
-            "DAY": "DAILY",
-            "YEAR": "YEARLY",
-            "HOUR": "HOURLY",
-            "WEEK": "WEEKLY",
-            "MONTH": "MONTHLY",
-        }
-        mapped_interval = interval_mapping.get(interval.upper(), None)
-        if mapped_interval and mapped_interval in CompensationInterval.__members__:
-            return CompensationInterval[mapped_interval]
-        else:
-            raise ValueError(f"Unsupported interval: {interval}")
-
     api_headers = {
         "Host": "apis.indeed.com",
         "content-type": "application/json",
@@ -353,7 +434,7 @@ class IndeedScraper(Scraper):
             {what}
             {location}
             includeSponsoredResults: NONE
-            limit: 100
+            limit: {limit}
             sort: DATE
             {cursor}
             {filters}
@@ -364,68 +445,7 @@ class IndeedScraper(Scraper):
             results {{
               trackingKey
               job {{
-                key
-                title
-                datePublished
-                dateOnIndeed
-                description {{
-                  html
-                }}
-                location {{
-                  countryName
-                  countryCode
-                  admin1Code
-                  city
-                  postalCode
-                  streetAddress
-                  formatted {{
-                    short
-                    long
-                  }}
-                }}
-                compensation {{
-                  baseSalary {{
-                    unitOfWork
-                    range {{
-                      ... on Range {{
-                        min
-                        max
-                      }}
-                    }}
-                  }}
-                  currencyCode
-                }}
-                attributes {{
-                  key
-                  label
-                }}
-                employer {{
-                  relativeCompanyPageUrl
-                  name
-                  dossier {{
-                      employerDetails {{
-                        addresses
-                        industry
-                        employeesLocalizedLabel
-                        revenueLocalizedLabel
-                        briefDescription
-                        ceoName
-                        ceoPhotoUrl
-                      }}
-                      images {{
-                            headerImageUrl
-                            squareLogoUrl
-                      }}
-                      links {{
-                        corporateWebsite
-                    }}
-                  }}
-                }}
-                recruit {{
-                  viewJobUrl
-                  detailedSalary
-                  workSchedule
-                }}
+                {job}
               }}
             }}
           }}
@@ -7,35 +7,48 @@ This module contains routines to scrape LinkedIn.
 
 from __future__ import annotations
 
-import time
+import math
 import random
 from typing import Optional
 from datetime import datetime
 
-from threading import Lock
 from bs4.element import Tag
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urlunparse
 
 from .. import Scraper, ScraperInput, Site
 from ..exceptions import LinkedInException
-from ..utils import create_session
+from ..utils import create_session, fetch_pages_in_order, get_hedger, RateLimiter
 from ...jobs import (
     JobPost,
     Location,
     JobResponse,
     JobType,
     Country,
-    Compensation,
     DescriptionFormat,
 )
 from ..utils import (
     logger,
-    extract_emails_from_text,
+    analyze_text,
     get_enum_from_job_type,
-    currency_parser,
     markdown_converter,
 )
+from ..salary import parse_salary
+
+# Shared by every scraper instance, so the parallel page fetches of all
+# concurrent searches together stay under one request rate
+search_rate_limiter = RateLimiter(rate=0.5)
+
+
+def _is_job_page(response) -> bool:
+    """
+    Whether a job page response is worth caching; the authwall and signup
+    pages are also served with a 200
+    """
+    url = str(response.url)
+    if "/signup" in url or "/authwall" in url:
+        return False
+    return "show-more-less-html__markup" in response.text
 
 
 class LinkedInScraper(Scraper):
@@ -43,6 +56,7 @@ class LinkedInScraper(Scraper):
     delay = 3
     band_delay = 4
     jobs_per_page = 25
+    max_concurrent_pages = 4
 
     def __init__(self, proxy: Optional[str] = None):
         """
@@ -61,42 +75,115 @@ class LinkedInScraper(Scraper):
         self.scraper_input = scraper_input
         job_list: list[JobPost] = []
         seen_urls = set()
-        url_lock = Lock()
         page = scraper_input.offset // 25 + 25 if scraper_input.offset else 0
-        seconds_old = (
-            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
-        )
+        if scraper_input.linkedin_parallel_pages:
+            return self._scrape_parallel(page, seen_urls)
         continue_search = (
             lambda: len(job_list) < scraper_input.results_wanted and page < 1000
         )
         while continue_search():
             logger.info(f"LinkedIn search page: {page // 25 + 1}")
-            session = create_session(is_tls=False, has_retry=True, delay=5)
-            params = {
-                "keywords": scraper_input.search_term,
-                "location": scraper_input.location,
-                "distance": scraper_input.distance,
-                "f_WT": 2 if scraper_input.is_remote else None,
-                "f_JT": (
-                    self.job_type_code(scraper_input.job_type)
-                    if scraper_input.job_type
-                    else None
-                ),
-                "pageNum": 0,
-                "start": page + scraper_input.offset,
-                "f_AL": "true" if scraper_input.easy_apply else None,
-                "f_C": (
-                    ",".join(map(str, scraper_input.linkedin_company_ids))
-                    if scraper_input.linkedin_company_ids
-                    else None
-                ),
-            }
-            if seconds_old is not None:
-                params["f_TPR"] = f"r{seconds_old}"
-
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                response = session.get(
+            job_cards = self._fetch_search_page(page + scraper_input.offset)
+            if not job_cards:
+                return JobResponse(jobs=job_list)
+
+            jobs = self._process_cards(
+                job_cards, seen_urls, scraper_input.results_wanted - len(job_list)
+            )
+            job_list += jobs
+            if not self.page_scraped(len(jobs)):
+                break
+            if continue_search():
+                if not self.pause(random.uniform(self.delay, self.delay + self.band_delay)):
+                    break
+                page += self.jobs_per_page
+
+        job_list = job_list[: scraper_input.results_wanted]
+        return JobResponse(jobs=job_list)
+
+    def _scrape_parallel(self, page: int, seen_urls: set) -> JobResponse:
+        """
+        Fetches the search pages needed for results_wanted concurrently by
+        start offset, spaced out by the shared search rate limiter, and
+        merges them in offset order. The first page without cards stops
+        the offsets after it from being requested; while every page comes
+        back full but duplicates leave results_wanted unmet, further
+        offsets are fetched for the shortfall.
+        """
+        scraper_input = self.scraper_input
+
+        def fetch_page(start: int) -> list[Tag]:
+            if self.quota is not None and self.quota.stop.is_set():
+                # an empty page makes fetch_pages_in_order drop the later ones
+                return []
+            search_rate_limiter.wait()
+            logger.info(f"LinkedIn search page: {(start - scraper_input.offset) // 25 + 1}")
+            job_cards = self._fetch_search_page(start) or []
+            self.page_scraped(len(job_cards))
+            return job_cards
+
+        job_list: list[JobPost] = []
+        while len(job_list) < scraper_input.results_wanted and page < 1000:
+            pages_needed = math.ceil(
+                (scraper_input.results_wanted - len(job_list)) / self.jobs_per_page
+            )
+            offsets = [
+                scraper_input.offset + page + i * self.jobs_per_page
+                for i in range(pages_needed)
+                if page + i * self.jobs_per_page < 1000
+            ]
+            pages = fetch_pages_in_order(
+                fetch_page, offsets, self.max_concurrent_pages, self.io_executor
+            )
+            for job_cards in pages:
+                job_list += self._process_cards(
+                    job_cards, seen_urls, scraper_input.results_wanted - len(job_list)
+                )
+                if len(job_list) >= scraper_input.results_wanted:
+                    break
+            if len(pages) < len(offsets):
+                # an empty page: the results, or the quota, ran out
+                break
+            page += len(offsets) * self.jobs_per_page
+        return JobResponse(jobs=job_list)
+
+    def _fetch_search_page(self, start: int) -> list[Tag] | None:
+        """
+        Fetches the job cards of the guest search page at a start offset
+        :return: job cards, None when the request failed (self.error is set)
+        """
+        scraper_input = self.scraper_input
+        seconds_old = (
+            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        )
+        params = {
+            "keywords": scraper_input.search_term,
+            "location": scraper_input.location,
+            "distance": scraper_input.distance,
+            "f_WT": 2 if scraper_input.is_remote else None,
+            "f_JT": (
+                self.job_type_code(scraper_input.job_type)
+                if scraper_input.job_type
+                else None
+            ),
+            "pageNum": 0,
+            "start": start,
+            "f_AL": "true" if scraper_input.easy_apply else None,
+            "f_C": (
+                ",".join(map(str, scraper_input.linkedin_company_ids))
+                if scraper_input.linkedin_company_ids
+                else None
+            ),
+        }
+        if seconds_old is not None:
+            params["f_TPR"] = f"r{seconds_old}"
+
+        params = {k: v for k, v in params.items() if v is not None}
+        try:
+            # each attempt gets its own session, so a hedge goes out
+            # over a fresh connection
+            response = get_hedger("linkedin").request(
+                lambda: create_session(is_tls=False, has_retry=True, delay=5).get(
                     f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
                     params=params,
                     allow_redirects=True,
@@ -104,56 +191,58 @@ class LinkedInScraper(Scraper):
                     headers=self.headers,
                     timeout=10,
                 )
-                if response.status_code not in range(200, 400):
-                    if response.status_code == 429:
-                        err = (
-                            f"429 Response - Blocked by LinkedIn for too many requests"
-                        )
-                    else:
-                        err = f"LinkedIn response status code {response.status_code}"
-                        err += f" - {response.text}"
-                    logger.error(err)
-                    return JobResponse(jobs=job_list)
-            except Exception as e:
-                if "Proxy responded with" in str(e):
-                    logger.error(f"LinkedIn: Bad proxy")
+            )
+            if response.status_code not in range(200, 400):
+                if response.status_code == 429:
+                    err = (
+                        f"429 Response - Blocked by LinkedIn for too many requests"
+                    )
                 else:
-                    logger.error(f"LinkedIn: {str(e)}")
-                return JobResponse(jobs=job_list)
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
-            if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
-
-            for job_card in job_cards:
-                job_url = None
-                href_tag = job_card.find("a", class_="base-card__full-link")
-                if href_tag and "href" in href_tag.attrs:
-                    href = href_tag.attrs["href"].split("?")[0]
-                    job_id = href.split("-")[-1]
-                    job_url = f"{self.base_url}/jobs/view/{job_id}"
-
-                with url_lock:
-                    if job_url in seen_urls:
-                        continue
-                    seen_urls.add(job_url)
-                try:
-                    fetch_desc = scraper_input.linkedin_fetch_description
-                    job_post = self._process_job(job_card, job_url, fetch_desc)
-                    if job_post:
-                        job_list.append(job_post)
-                    if not continue_search():
-                        break
-                except Exception as e:
-                    raise LinkedInException(str(e))
+                    err = f"LinkedIn response status code {response.status_code}"
+                    err += f" - {response.text}"
+                logger.error(err)
+                self.error = err
+                return None
+        except Exception as e:
+            if "Proxy responded with" in str(e):
+                logger.error(f"LinkedIn: Bad proxy")
+            else:
+                logger.error(f"LinkedIn: {str(e)}")
+            self.error = str(e)
+            return None
 
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                page += self.jobs_per_page
+        soup = BeautifulSoup(response.text, "html.parser")
+        return soup.find_all("div", class_="base-search-card")
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+    def _process_cards(
+        self, job_cards: list[Tag], seen_urls: set, limit: int
+    ) -> list[JobPost]:
+        """
+        Turns a page of job cards into posts, skipping jobs already seen
+        :param limit: posts wanted at most
+        """
+        jobs = []
+        for job_card in job_cards:
+            if len(jobs) >= limit:
+                break
+            job_url = None
+            href_tag = job_card.find("a", class_="base-card__full-link")
+            if href_tag and "href" in href_tag.attrs:
+                href = href_tag.attrs["href"].split("?")[0]
+                job_id = href.split("-")[-1]
+                job_url = f"{self.base_url}/jobs/view/{job_id}"
+
+            if job_url in seen_urls:
+                continue
+            seen_urls.add(job_url)
+            try:
+                fetch_desc = self.scraper_input.linkedin_fetch_description
+                job_post = self._process_job(job_card, job_url, fetch_desc)
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as e:
+                raise LinkedInException(str(e))
+        return jobs
 
     def _process_job(
         self, job_card: Tag, job_url: str, full_descr: bool
@@ -163,16 +252,7 @@ class LinkedInScraper(Scraper):
         compensation = None
         if salary_tag:
             salary_text = salary_tag.get_text(separator=" ").strip()
-            salary_values = [currency_parser(value) for value in salary_text.split("-")]
-            salary_min = salary_values[0]
-            salary_max = salary_values[1]
-            currency = salary_text[0] if salary_text[0] != "$" else "USD"
-
-            compensation = Compensation(
-                min_amount=int(salary_min),
-                max_amount=int(salary_max),
-                currency=currency,
-            )
+            compensation = parse_salary(salary_text)
 
         title_tag = job_card.find("span", class_="sr-only")
         title = title_tag.get_text(strip=True) if title_tag else "N/A"
@@ -204,6 +284,11 @@ class LinkedInScraper(Scraper):
         benefits_tag = job_card.find("span", class_="result-benefits__text")
         if full_descr:
             description, job_type = self._get_job_description(job_url)
+        analysis = analyze_text(
+            description,
+            title,
+            metadata_card.get_text(" ", strip=True) if metadata_card else None,
+        )
 
         return JobPost(
             title=title,
@@ -215,7 +300,8 @@ class LinkedInScraper(Scraper):
             compensation=compensation,
             job_type=job_type,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=analysis.emails,
+            is_remote=analysis.remote,
         )
 
     def _get_job_description(
@@ -227,7 +313,9 @@ class LinkedInScraper(Scraper):
         :return: description or None
         """
         try:
-            session = create_session(is_tls=False, has_retry=True)
+            session = create_session(
+                is_tls=False, has_retry=True, cache=True, cacheable=_is_job_page
+            )
             response = session.get(
                 job_page_url, headers=self.headers, timeout=5, proxies=self.proxy
             )
@@ -0,0 +1,191 @@
+"""
+jobspy.scrapers.proxies
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the proxy pool shared by all scrapers: weighted
+selection by recent success rate and latency, per-proxy concurrency caps,
+quarantine of failing proxies and sticky assignment for callers whose
+session or token is bound to one address.
+"""
+
+from __future__ import annotations
+
+import time
+import random
+from threading import Condition, Lock
+
+from .utils import logger
+
+
+class ProxyState:
+    def __init__(self, url: str, alpha: float = 0.2):
+        self.url = url
+        self.alpha = alpha
+        self.success_rate = 1.0
+        self.latency: float | None = None
+        self.in_flight = 0
+        self.failures_in_row = 0
+        self.quarantined_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def weight(self) -> float:
+        # reliability counts twice as much as speed
+        return self.success_rate**2 / max(self.latency or 1.0, 0.1)
+
+    def quarantined(self, now: float) -> bool:
+        return now < self.quarantined_until
+
+    def record(self, success: bool, latency: float | None) -> None:
+        self.requests += 1
+        self.success_rate += self.alpha * (float(success) - self.success_rate)
+        if success:
+            self.failures_in_row = 0
+            if latency is not None:
+                self.latency = latency if self.latency is None else (
+                    self.latency + self.alpha * (latency - self.latency)
+                )
+        else:
+            self.failures += 1
+            self.failures_in_row += 1
+
+    def snapshot(self, now: float) -> dict:
+        return {
+            "success_rate": round(self.success_rate, 3),
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "quarantined_for": max(0.0, round(self.quarantined_until - now, 1)),
+        }
+
+
+class ProxyPool:
+    def __init__(
+        self,
+        proxies: list[str],
+        max_concurrent: int = 4,
+        quarantine_after: int = 3,
+        quarantine_seconds: float = 120.0,
+        acquire_timeout: float = 30.0,
+    ):
+        """
+        :param max_concurrent: scrapes allowed through one proxy at once
+        :param quarantine_after: failures in a row that quarantine a proxy
+        :param quarantine_seconds: how long a failing proxy sits out; doubles
+            for each further failure up to an hour
+        :param acquire_timeout: seconds to wait for a free proxy before
+            going over the concurrency cap of the best one
+        """
+        if not proxies:
+            raise ValueError("ProxyPool needs at least one proxy")
+        self.max_concurrent = max_concurrent
+        self.quarantine_after = quarantine_after
+        self.quarantine_seconds = quarantine_seconds
+        self.acquire_timeout = acquire_timeout
+        self._proxies = {url: ProxyState(url) for url in dict.fromkeys(proxies)}
+        # sticky key -> proxy, for a session, token or cookie jar that is
+        # tied to the address it was created from
+        self._sticky: dict[str, str] = {}
+        self._condition = Condition()
+
+    def _eligible(self, now: float, capped: bool = True) -> list[ProxyState]:
+        proxies = [p for p in self._proxies.values() if not p.quarantined(now)]
+        if not proxies:
+            # never fall back to a direct connection; use whichever
+            # quarantined proxy comes back first
+            proxies = [min(self._proxies.values(), key=lambda p: p.quarantined_until)]
+        if capped:
+            proxies = [p for p in proxies if p.in_flight < self.max_concurrent]
+        return proxies
+
+    def acquire(self, sticky_key: str | None = None) -> str:
+        """
+        Picks a proxy and counts it as in use until release()
+        :param sticky_key: keeps returning the same proxy for this key while
+            that proxy stays healthy
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while True:
+                now = time.time()
+                proxy = self._pick(now, sticky_key)
+                if proxy is None and time.monotonic() >= deadline:
+                    proxy = max(self._eligible(now, capped=False), key=lambda p: p.weight)
+                if proxy is not None:
+                    proxy.in_flight += 1
+                    if sticky_key is not None:
+                        self._sticky[sticky_key] = proxy.url
+                    return proxy.url
+                self._condition.wait(max(0.0, deadline - time.monotonic()))
+
+    def _pick(self, now: float, sticky_key: str | None) -> ProxyState | None:
+        if sticky_key is not None and sticky_key in self._sticky:
+            proxy = self._proxies[self._sticky[sticky_key]]
+            if not proxy.quarantined(now):
+                # wait for the sticky proxy rather than break session affinity
+                return proxy if proxy.in_flight < self.max_concurrent else None
+            logger.info(f"{sticky_key}: sticky proxy quarantined, reassigning")
+            del self._sticky[sticky_key]
+        eligible = self._eligible(now)
+        if not eligible:
+            return None
+        return random.choices(eligible, weights=[p.weight for p in eligible])[0]
+
+    def release(self, url: str, success: bool, latency: float | None = None) -> None:
+        """
+        Returns a proxy to the pool with the outcome of the work done through it
+        :param latency: seconds per request, for successful work
+        """
+        with self._condition:
+            proxy = self._proxies[url]
+            proxy.in_flight -= 1
+            proxy.record(success, latency)
+            if not success and proxy.failures_in_row >= self.quarantine_after:
+                strikes = proxy.failures_in_row - self.quarantine_after
+                seconds = min(self.quarantine_seconds * 2**strikes, 60 * 60)
+                proxy.quarantined_until = time.time() + seconds
+                logger.warning(f"Proxy {_redact(url)} quarantined for {seconds:.0f}s")
+            self._condition.notify_all()
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        with self._condition:
+            return {
+                "proxies": {
+                    _redact(url): proxy.snapshot(now) for url, proxy in self._proxies.items()
+                },
+                "sticky": {key: _redact(url) for key, url in self._sticky.items()},
+            }
+
+
+def _redact(url: str) -> str:
+    """
+    Drops credentials from a proxy url.
+    """
+    scheme, sep, rest = url.rpartition("://")
+    return f"{scheme}{sep}{rest.rpartition('@')[2]}"
+
+
+_pools: dict[tuple[str, ...], ProxyPool] = {}
+_pools_lock = Lock()
+
+
+def get_proxy_pool(proxies: list[str] | tuple[str, ...]) -> ProxyPool:
+    """
+    Process-wide pool for a list of proxies, so health carries over between
+    searches using the same proxies.
+    """
+    key = tuple(proxies)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ProxyPool(list(proxies))
+        return pool
+
+
+def proxy_pools_snapshot() -> list[dict]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.snapshot() for pool in pools]
@@ -0,0 +1,253 @@
+"""
+jobspy.scrapers.salary
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the shared salary parsing and normalization routines:
+raw salary strings and interval labels to Compensation, and annualized
+amounts in a common currency over a whole result set.
+"""
+
+from __future__ import annotations
+
+import re
+
+from ..jobs import Compensation, CompensationInterval
+
+CURRENCY_SYMBOLS = {
+    "CA$": "CAD",
+    "C$": "CAD",
+    "AU$": "AUD",
+    "A$": "AUD",
+    "NZ$": "NZD",
+    "HK$": "HKD",
+    "S$": "SGD",
+    "R$": "BRL",
+    "£": "GBP",
+    "€": "EUR",
+    "₹": "INR",
+    "¥": "JPY",
+    "zł": "PLN",
+    "$": "USD",
+}
+CURRENCY_CODES = (
+    "GBP", "USD", "EUR", "CAD", "AUD", "NZD", "HKD", "SGD", "BRL", "INR", "JPY",
+    "PLN", "CHF", "SEK", "NOK", "DKK", "ZAR", "AED", "MXN",
+)
+
+# Static conversion rates to USD; good enough to rank and filter by pay
+USD_RATES = {
+    "USD": 1.0,
+    "GBP": 1.27,
+    "EUR": 1.08,
+    "CAD": 0.73,
+    "AUD": 0.66,
+    "NZD": 0.61,
+    "HKD": 0.128,
+    "SGD": 0.74,
+    "BRL": 0.20,
+    "INR": 0.012,
+    "JPY": 0.0067,
+    "PLN": 0.25,
+    "CHF": 1.13,
+    "SEK": 0.095,
+    "NOK": 0.094,
+    "DKK": 0.145,
+    "ZAR": 0.054,
+    "AED": 0.27,
+    "MXN": 0.058,
+}
+
+# Periods per year, assuming a 40 hour, 5 day working week
+ANNUAL_MULTIPLIERS = {
+    CompensationInterval.YEARLY.value: 1,
+    CompensationInterval.MONTHLY.value: 12,
+    CompensationInterval.WEEKLY.value: 52,
+    CompensationInterval.DAILY.value: 260,
+    CompensationInterval.HOURLY.value: 2080,
+}
+
+INTERVAL_ALIASES = {
+    "year": CompensationInterval.YEARLY,
+    "yearly": CompensationInterval.YEARLY,
+    "annual": CompensationInterval.YEARLY,
+    "annually": CompensationInterval.YEARLY,
+    "annum": CompensationInterval.YEARLY,
+    "month": CompensationInterval.MONTHLY,
+    "monthly": CompensationInterval.MONTHLY,
+    "week": CompensationInterval.WEEKLY,
+    "weekly": CompensationInterval.WEEKLY,
+    "day": CompensationInterval.DAILY,
+    "daily": CompensationInterval.DAILY,
+    "hour": CompensationInterval.HOURLY,
+    "hourly": CompensationInterval.HOURLY,
+}
+
+INTERVAL_PATTERNS = [
+    (re.compile(r"per\s+annum|\bp\.?\s?a\b|per\s+year|a\s+year|/\s*y(?:ea)?r|annual|yearly"), CompensationInterval.YEARLY),
+    (re.compile(r"per\s+month|/\s*mo(?:nth)?\b|monthly|\bpcm\b"), CompensationInterval.MONTHLY),
+    (re.compile(r"per\s+week|/\s*w(?:ee)?k\b|weekly"), CompensationInterval.WEEKLY),
+    (re.compile(r"per\s+day|/\s*day\b|daily|day\s+rate|\bp/?d\b"), CompensationInterval.DAILY),
+    (re.compile(r"per\s+hour|an\s+hour|/\s*h(?:ou)?r\b|hourly|\bp/?h\b"), CompensationInterval.HOURLY),
+]
+CODE_RE = re.compile(r"\b(" + "|".join(CURRENCY_CODES) + r")\b")
+_SYMBOLS = "|".join(re.escape(symbol) for symbol in CURRENCY_SYMBOLS)
+_CODES = "|".join(CURRENCY_CODES)
+# an amount with its currency, multiplier suffix and any non-pay unit after it
+AMOUNT_RE = re.compile(
+    rf"(?P<currency>(?:{_SYMBOLS})\s*|\b(?:{_CODES})\s*)?"
+    r"(?P<number>\d[\d,]*(?:\.\d+)?)"
+    r"(?:\s*(?P<suffix>[kKmM])\b)?"
+    rf"(?P<code>\s*(?:{_CODES})\b)?"
+    r"(?P<unit>\s*(?:%|(?:days?|hours?|hrs?|weeks?|wks?)\b))?"
+)
+RANGE_SEPARATOR_RE = re.compile(r"\s*(?:-|–|—|to)\s*$", re.IGNORECASE)
+
+
+def normalize_interval(value: str | CompensationInterval | None) -> CompensationInterval | None:
+    """
+    Maps interval labels used by the job boards (ANNUAL, YEAR, hourly, ...) to
+    CompensationInterval.
+    """
+    if value is None or isinstance(value, CompensationInterval):
+        return value
+    return INTERVAL_ALIASES.get(value.strip().lower())
+
+
+def parse_currency(text: str, default: str | None = None) -> str | None:
+    code = CODE_RE.search(text.upper())
+    if code:
+        return code.group(1)
+    for symbol, currency in CURRENCY_SYMBOLS.items():
+        if symbol in text:
+            return currency
+    return default
+
+
+def infer_interval(amount: float) -> CompensationInterval:
+    """
+    Best guess at the pay period from the size of the amount
+    """
+    if amount < 200:
+        return CompensationInterval.HOURLY
+    if amount < 2000:
+        return CompensationInterval.DAILY
+    if amount < 15000:
+        return CompensationInterval.MONTHLY
+    return CompensationInterval.YEARLY
+
+
+def _find_amounts(text: str) -> list[float]:
+    """
+    Amounts in text that read as pay: next to a currency symbol or code, with
+    a k/m suffix, or on either side of a range ("35,000 - 40,000"). Numbers
+    followed by days, hours, weeks or % are skipped, along with the other end
+    of their range ("25-30 days holiday"). A suffix on one end of a range
+    also applies to a bare number under 1000 on the other ("£40-50k").
+    """
+    matches = list(AMOUNT_RE.finditer(text))
+    numbers = [float(match.group("number").replace(",", "")) for match in matches]
+    multipliers = [_multiplier(match.group("suffix")) for match in matches]
+    ranged = [False] * len(matches)
+    skipped = [bool(match.group("unit")) for match in matches]
+    for i in range(1, len(matches)):
+        if not RANGE_SEPARATOR_RE.match(text[matches[i - 1].end():matches[i].start()]):
+            continue
+        ranged[i - 1] = ranged[i] = True
+        skipped[i - 1] = skipped[i] = skipped[i - 1] or skipped[i]
+        for bare, other in ((i - 1, i), (i, i - 1)):
+            if multipliers[bare] == 1 and numbers[bare] < 1000:
+                multipliers[bare] = multipliers[other]
+
+    amounts = []
+    for match, number, multiplier, in_range, skip in zip(
+        matches, numbers, multipliers, ranged, skipped
+    ):
+        if skip or not (
+            in_range or match.group("currency") or match.group("suffix") or match.group("code")
+        ):
+            continue
+        if number > 0:
+            amounts.append(number * multiplier)
+    return amounts
+
+
+def _multiplier(suffix: str | None) -> int:
+    if not suffix:
+        return 1
+    return 1000 if suffix.lower() == "k" else 1000000
+
+
+def parse_salary(
+    text: str | None,
+    default_currency: str | None = "USD",
+    default_interval: CompensationInterval | None = None,
+) -> Compensation | None:
+    """
+    Parses free-text salaries such as "£35,000 - £40,000 per annum",
+    "$45/hr", "£300-£350 per day" or "Up to €60k".
+    :return: Compensation, or None when the text has no amount
+    """
+    if not text:
+        return None
+    lowered = text.lower()
+    amounts = _find_amounts(text)
+    if not amounts:
+        return None
+
+    min_amount, max_amount = amounts[0], amounts[1] if len(amounts) > 1 else amounts[0]
+    if len(amounts) == 1 and re.search(r"\bup\s+to\b", lowered):
+        min_amount = None
+    elif len(amounts) == 1 and re.search(r"\b(?:from|starting)\b", lowered):
+        max_amount = None
+    elif max_amount < min_amount:
+        max_amount = None
+
+    interval = default_interval
+    for pattern, pattern_interval in INTERVAL_PATTERNS:
+        if pattern.search(lowered):
+            interval = pattern_interval
+            break
+    if interval is None:
+        interval = infer_interval(max_amount or min_amount)
+
+    return Compensation(
+        interval=interval,
+        min_amount=round(min_amount, 2) if min_amount is not None else None,
+        max_amount=round(max_amount, 2) if max_amount is not None else None,
+        currency=parse_currency(text, default_currency),
+    )
+
+
+def annualize(records: list[dict], currency: str = "USD") -> None:
+    """
+    Adds annual_min_amount, annual_max_amount and annual_currency to each
+    result row, converting every pay interval and currency in one
+    vectorized pass over the result set.
+    """
+    if not records:
+        return
+    import numpy as np
+
+    target_rate = USD_RATES.get(currency)
+    if target_rate is None:
+        raise ValueError(f"Unsupported currency: {currency}")
+
+    def column(values):
+        return np.array(
+            [np.nan if value is None else value for value in values], dtype=float
+        )
+
+    min_amounts = column(r["min_amount"] for r in records)
+    max_amounts = column(r["max_amount"] for r in records)
+    multipliers = column(ANNUAL_MULTIPLIERS.get(r["interval"]) for r in records)
+    rates = column(USD_RATES.get(r["currency"]) for r in records) / target_rate
+
+    factor = multipliers * rates
+    annual_min = np.round(min_amounts * factor).tolist()
+    annual_max = np.round(max_amounts * factor).tolist()
+    for record, low, high in zip(records, annual_min, annual_max):
+        record["annual_min_amount"] = None if low != low else low
+        record["annual_max_amount"] = None if high != high else high
+        record["annual_currency"] = (
+            currency if record["annual_min_amount"] or record["annual_max_amount"] else None
+        )
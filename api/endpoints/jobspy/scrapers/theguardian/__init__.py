@@ -2,10 +2,15 @@ import requests
 from bs4 import BeautifulSoup
 from typing import Optional, Tuple, List
 from datetime import datetime
+import math
 import re
+import threading
 
 from .. import Scraper, ScraperInput, Site
-from ..utils import create_session, logger
+from ..utils import analyze_text, create_session, fetch_pages_in_order, logger, RateLimiter
+from ..details import DetailEnricher
+from ..cache import cached_session
+from ..salary import parse_salary
 from ...jobs import (
     JobPost,
     Compensation,
@@ -14,7 +19,13 @@ from ...jobs import (
     JobType,
 )
 
+# Shared by every scraper instance so concurrent searches stay polite
+detail_rate_limiter = RateLimiter(rate=5)
+
+
 class TheGuardianScraper(Scraper):
+    max_concurrent_pages = 4
+
     def __init__(self, proxy: Optional[str] = None):
         """
         Initializes TheGuardianScraper with the The Guardian Jobs search url
@@ -22,6 +33,7 @@ class TheGuardianScraper(Scraper):
         site = Site(Site.THE_GUARDIAN)
         super().__init__(site, proxy=proxy)
         self.base_url = "https://jobs.theguardian.com"
+        self._local = threading.local()
         
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -30,71 +42,107 @@ class TheGuardianScraper(Scraper):
         :return: JobResponse containing a list of jobs.
         """
         self.scraper_input = scraper_input
-        self.session = create_session(self.proxy)
-        # Add browser-like headers to avoid 403
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        })
-
-        all_jobs: List[JobPost] = []
-        
+
         # Build URL
-        params = {}
+        self.params = {}
         if scraper_input.search_term:
-            params["Keywords"] = scraper_input.search_term
+            self.params["Keywords"] = scraper_input.search_term
         if scraper_input.location:
-            params["location"] = scraper_input.location
-            
-        # Pagination
-        page = 1
-        while len(all_jobs) < scraper_input.results_wanted:
-            try:
-                # Calculate current page URL (The Guardian uses page parameter, e.g. /jobs/page/2/)
-                # Base search URL: https://jobs.theguardian.com/jobs/
-                # With params: https://jobs.theguardian.com/jobs/?Keywords=php
-                # Pagination seems to be typically: https://jobs.theguardian.com/jobs/page/2/?Keywords=php
-                
-                url = f"{self.base_url}/jobs/"
-                if page > 1:
-                    url = f"{url}page/{page}/"
-                
-                response = self.session.get(url, params=params)
-                if response.status_code != 200:
-                    break
-                    
-                soup = BeautifulSoup(response.text, "html.parser")
-                job_listings = soup.select(".lister__item") 
-                
-                if not job_listings:
-                    break # No more jobs found
-                
-                for job_card in job_listings:
-                    if len(all_jobs) >= scraper_input.results_wanted:
-                        break
-                        
-                    job = self._process_job(job_card)
-                    if job:
-                        all_jobs.append(job)
-                        
-                # Check for next page
-                # The pagination links usually look like "Next" text or class pagination__link--next
-                # In the HTML generic, let's look for a generic next link if possible, or just rely on loop increment
-                # The generic pagination usually has a class like 'pagination__item--next' or similar
-                # "Load more" isn't present, it's a standard pagination
-                next_button = soup.select_one(".pagination__item--next a, .paginator__item--next a")
-                if not next_button:
-                    # If we can't find next button but found jobs, we might try incrementing page anyway until 404 or empty
-                    if len(job_listings) < 10: # If we found few jobs, likely last page
-                        break
-                page += 1
-                
-            except Exception as e:
-                logger.error(f"Error scraping The Guardian: {e}")
-                break
+            self.params["location"] = scraper_input.location
+
+        soup = self._get_page(1)
+        if soup is None:
+            return JobResponse(jobs=[])
+        job_listings = soup.select(".lister__item")
+        all_jobs: List[JobPost] = self._parse_listings(job_listings)
+        more_wanted = self.page_scraped(len(all_jobs))
+
+        # The pagination links usually look like "Next" text or class pagination__link--next
+        # If we can't find the next button but found a full page, there may still be more
+        next_button = soup.select_one(".pagination__item--next a, .paginator__item--next a")
+        has_next = next_button is not None or len(job_listings) >= 10
+        if job_listings and has_next and more_wanted and len(all_jobs) < scraper_input.results_wanted:
+            # Page urls are predictable (/jobs/page/{n}/), so fetch the rest concurrently
+            pages_needed = math.ceil(scraper_input.results_wanted / len(job_listings))
+            for jobs in fetch_pages_in_order(
+                self._fetch_page,
+                range(2, pages_needed + 1),
+                self.max_concurrent_pages,
+                self.io_executor,
+            ):
+                all_jobs.extend(jobs)
 
+        all_jobs = all_jobs[: scraper_input.results_wanted]
+        if scraper_input.fetch_job_details:
+            all_jobs = DetailEnricher(
+                self._fetch_detail_page,
+                detail_rate_limiter,
+                executor=self.io_executor,
+                description_selectors=(".job-description", ".mds-edited-text", "[itemprop=description]"),
+            ).enrich(all_jobs, scraper_input.description_format)
         return JobResponse(jobs=all_jobs)
 
+    def _session(self):
+        """
+        One session per worker thread, with browser-like headers to avoid 403
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = create_session(self.proxy)
+            session.headers.update({
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+            })
+            self._local.session = session
+        return session
+
+    def _get_page(self, page: int) -> Optional[BeautifulSoup]:
+        """
+        Fetches a search results page, e.g. https://jobs.theguardian.com/jobs/page/2/?Keywords=php
+        """
+        url = f"{self.base_url}/jobs/"
+        if page > 1:
+            url = f"{url}page/{page}/"
+        try:
+            response = self._session().get(url, params=self.params)
+        except Exception as e:
+            logger.error(f"Error scraping The Guardian: {e}")
+            self.error = str(e)
+            return None
+        if response.status_code != 200:
+            # past the last page the site answers 404; that's the end of the
+            # results, not a failed search
+            if page == 1 or response.status_code in (403, 429):
+                self.error = f"status code {response.status_code}"
+            return None
+        return BeautifulSoup(response.text, "html.parser")
+
+    def _fetch_detail_page(self, job_url: str) -> Optional[str]:
+        response = cached_session(self._session()).get(job_url)
+        if response.status_code != 200:
+            logger.error(f"The Guardian detail page status code: {response.status_code}")
+            return None
+        return response.text
+
+    def _fetch_page(self, page: int) -> List[JobPost]:
+        if self.quota is not None and self.quota.stop.is_set():
+            # an empty page makes fetch_pages_in_order drop the later ones
+            return []
+        soup = self._get_page(page)
+        if soup is None:
+            return []
+        jobs = self._parse_listings(soup.select(".lister__item"))
+        self.page_scraped(len(jobs))
+        return jobs
+
+    def _parse_listings(self, job_listings) -> List[JobPost]:
+        jobs = []
+        for job_card in job_listings:
+            job = self._process_job(job_card)
+            if job:
+                jobs.append(job)
+        return jobs
+
     def _process_job(self, job_card) -> Optional[JobPost]:
         try:
             # Title and URL
@@ -139,9 +187,7 @@ class TheGuardianScraper(Scraper):
             salary_elem = job_card.select_one(".lister__meta-item--salary")
             if salary_elem:
                 salary_text = salary_elem.get_text(strip=True)
-                # Could parse "£35,000 - £40,000" here using regex
-                # For now returning raw string is not supported by object, so we skip or simple parse
-                pass
+                compensation = parse_salary(salary_text, default_currency="GBP")
 
             return JobPost(
                 title=title,
@@ -149,7 +195,9 @@ class TheGuardianScraper(Scraper):
                 job_url=job_url,
                 location=location_obj,
                 date_posted=date_posted,
-                description=None
+                compensation=compensation,
+                description=None,
+                is_remote=analyze_text(title, loc_elem.get_text(strip=True) if loc_elem else None).remote,
             )
         except Exception:
             return None
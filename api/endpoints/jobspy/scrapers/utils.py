@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import os
 import re
+import math
+import time
 import logging
-import requests
-import tls_client
-import numpy as np
-from markdownify import markdownify as md
-from requests.adapters import HTTPAdapter, Retry
+from collections import deque
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, NamedTuple, Sequence, TypeVar
+from concurrent.futures import CancelledError, FIRST_COMPLETED, Future, wait
 
+from .executors import SharedExecutor, get_executor
 from ..jobs import JobType
 
+if TYPE_CHECKING:
+    import requests
+
+T = TypeVar("T")
+
 logger = logging.getLogger("JobSpy")
 logger.propagate = False
 if not logger.handlers:
@@ -41,15 +49,113 @@ def set_logger_level(verbose: int = 2):
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
+    from markdownify import markdownify as md
+
     markdown = md(description_html)
     return markdown.strip()
 
 
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+_EMAIL_LOCAL_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-"
+)
+_EMAIL_DOMAIN = re.compile(r"[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# needles matched against the lowercased text; str.find runs in C, which on
+# job descriptions beats a regex alternation over the same keywords several
+# times over, since re has no multi-literal prefilter
+REMOTE_MARKERS = {
+    "remote": ("remote",),
+    "work_from_home": (
+        "work from home",
+        "working from home",
+        "work-from-home",
+        "wfh",
+        "home based",
+        "home-based",
+        "telecommut",
+        "telework",
+    ),
+    "hybrid": ("hybrid",),
+}
+# phrases that start with a marker needle but aren't about where work is done
+NOT_MARKERS = ("remote control", "remote-control", "remote sensing", "remote-sensing")
+# a negation up to two words before a marker: "not remote", "no remote
+# working", "non-remote", "this is not a fully remote role"
+_MARKER_NEGATION = re.compile(
+    r"\b(?:no|not|non|never|without|isn't|cannot|can't)[\s-]+(?:[a-z]+[\s-]+){0,2}$"
+)
+
+
+class TextAnalysis(NamedTuple):
+    emails: list[str] | None
+    markers: frozenset[str]
+
+    @property
+    def remote(self) -> bool:
+        return bool(self.markers - {"hybrid"})
+
+    @property
+    def hybrid(self) -> bool:
+        return "hybrid" in self.markers
+
+
+def analyze_text(*texts: str | None) -> TextAnalysis:
+    """
+    Extracts emails and remote/hybrid/WFH markers from job text. Emails are
+    found from each "@"; markers with a substring search per needle over one
+    lowercased copy, which beats a combined regex alternation in CPython.
+    A marker counts only at the start of a word, outside NOT_MARKERS and
+    without a negation just before it
+    :param texts: description, title, location, attribute labels, ...
+    :return: emails deduplicated case-insensitively in order of appearance,
+        and the names of the REMOTE_MARKERS found
+    """
+    text = "\n".join(filter(None, texts))
+    lowered = text.lower()
+    markers = frozenset(
+        name
+        for name, needles in REMOTE_MARKERS.items()
+        if any(_has_marker(lowered, needle) for needle in needles)
+    )
+    return TextAnalysis(_find_emails(text), markers)
+
+
+def _has_marker(lowered: str, needle: str) -> bool:
+    at = lowered.find(needle)
+    while at != -1:
+        if (
+            not (at and lowered[at - 1].isalnum())
+            and not any(lowered.startswith(phrase, at) for phrase in NOT_MARKERS)
+            and not _MARKER_NEGATION.search(lowered[max(0, at - 40) : at])
+        ):
+            return True
+        at = lowered.find(needle, at + 1)
+    return False
+
+
+def _find_emails(text: str) -> list[str] | None:
+    """
+    Same matches as EMAIL_PATTERN.findall, but anchored on each "@" instead
+    of attempting a match at every character of the text.
+    """
+    emails: dict[str, str] = {}
+    end = 0
+    at = text.find("@")
+    while at != -1:
+        start = at
+        while start > end and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        domain = _EMAIL_DOMAIN.match(text, at + 1) if start < at else None
+        if domain:
+            email = text[start : domain.end()]
+            emails.setdefault(email.lower(), email)
+            end = domain.end()
+        at = text.find("@", end if domain else at + 1)
+    return list(emails.values()) or None
+
+
 def extract_emails_from_text(text: str) -> list[str] | None:
-    if not text:
-        return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return analyze_text(text).emails
 
 
 def create_session(
@@ -57,15 +163,25 @@ def create_session(
     is_tls: bool = True,
     has_retry: bool = False,
     delay: int = 1,
+    cache: bool = False,
+    cacheable: Callable[[object], bool] | None = None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    :param cache: serve GET/POST responses from the on-disk response cache;
+        meant for detail pages, which don't change once published
+    :param cacheable: with cache, whether a 200 response may be stored
     :return: A session object
     """
     if is_tls:
+        import tls_client
+
         session = tls_client.Session(random_tls_extension_order=True)
         session.proxies = proxy
     else:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
         session = requests.Session()
         session.allow_redirects = True
         if proxy:
@@ -82,9 +198,216 @@ def create_session(
 
             session.mount("http://", adapter)
             session.mount("https://", adapter)
+    if cache:
+        from .cache import cached_session
+
+        session = cached_session(session, cacheable)
     return session
 
 
+def fetch_pages_in_order(
+    fetch_page: Callable[[int], Sequence[T] | None],
+    pages: Sequence[int],
+    max_workers: int,
+    executor: SharedExecutor | None = None,
+) -> list[Sequence[T]]:
+    """
+    Fetches numbered pages concurrently with at most max_workers in flight.
+    An empty page marks the end of the results: pages after it that have not
+    started yet are cancelled and their results are discarded.
+    :param executor: pool to fetch on, the shared "io" one by default
+    :return: non-empty page results, in page order
+    """
+    executor = executor or get_executor("io")
+    pages = list(pages)
+    futures: dict[int, Future] = {}
+    end = [math.inf]  # first page known to be empty
+    lock = Lock()
+
+    def on_done(page: int, future: Future) -> None:
+        if future.cancelled() or future.exception() or future.result():
+            return
+        with lock:
+            end[0] = min(end[0], page)
+            later = [f for p, f in futures.items() if p > page]
+        for later_future in later:
+            later_future.cancel()
+
+    def submit(page: int) -> None:
+        with lock:
+            if page > end[0]:
+                return
+            future = futures[page] = executor.submit(fetch_page, page)
+        future.add_done_callback(lambda f: on_done(page, f))
+
+    for page in pages[:max_workers]:
+        submit(page)
+    results = []
+    try:
+        for i, page in enumerate(pages):
+            if page not in futures:
+                break
+            try:
+                result = futures[page].result()
+            except CancelledError:
+                break
+            if not result:
+                break
+            results.append(result)
+            if i + max_workers < len(pages):
+                submit(pages[i + max_workers])
+    finally:
+        for future in futures.values():
+            future.cancel()
+    return results
+
+
+class RateLimiter:
+    """
+    Spaces out calls to at most `rate` per second across all threads sharing it.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next_slot = 0.0
+        self._lock = Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Hedger:
+    """
+    Hedged requests for idempotent search page fetches: when the first
+    attempt hasn't answered within the observed p90 latency, a second attempt
+    is sent (over a fresh connection) and whichever answers first is used.
+    Hedges are limited to `budget` extra requests per request sent.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        enabled: bool = False,
+        budget: float = 0.05,
+        window: int = 200,
+        min_samples: int = 20,
+        max_delay: float = 5.0,
+    ):
+        """
+        :param enabled: when off, requests run inline and only latency is tracked
+        :param budget: hedges allowed per request, e.g. 0.05 for at most 5% extra load
+        :param window: latencies kept for the percentile
+        :param min_samples: latencies needed before hedging starts
+        :param max_delay: ceiling on the wait before hedging, in seconds
+        """
+        self.name = name
+        self.enabled = enabled
+        self.budget = budget
+        self.min_samples = min_samples
+        self.max_delay = max_delay
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._tokens = 1.0
+        self._lock = Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def p90(self) -> float | None:
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[int(len(latencies) * 0.9) - 1]
+
+    def _timed(self, send: Callable[[], T]) -> T:
+        started = time.monotonic()
+        result = send()
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+        return result
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.hedges += 1
+                return True
+            return False
+
+    def request(self, send: Callable[[], T]) -> T:
+        """
+        :param send: sends the request; called a second time to hedge, so it
+            must be idempotent and should open its own connection
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._tokens + self.budget, 1 + self.budget)
+        delay = self.p90() if self.enabled else None
+        if delay is None:
+            return self._timed(send)
+
+        # attempts run on the hedge pool so the caller can wait on the first
+        # one with a timeout; a losing attempt finishes in the background and
+        # its response is dropped
+        executor = get_executor("hedge")
+        first = executor.submit(self._timed, send)
+        done, _ = wait([first], timeout=min(delay, self.max_delay))
+        if done or not self._take_token():
+            return first.result()
+        logger.debug(f"{self.name}: no answer after {delay:.2f}s, hedging")
+        second = executor.submit(self._timed, send)
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is second:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        return first.result()
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "p90": self.p90(),
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+_hedgers: dict[str, Hedger] = {}
+_hedgers_lock = Lock()
+
+
+def get_hedger(name: str) -> Hedger:
+    """
+    Process-wide hedger for a site's search requests, configured from the
+    environment: JOBSPY_HEDGE (1 enables hedging) and JOBSPY_HEDGE_BUDGET
+    """
+    with _hedgers_lock:
+        hedger = _hedgers.get(name)
+        if hedger is None:
+            hedger = _hedgers[name] = Hedger(
+                name,
+                enabled=os.getenv("JOBSPY_HEDGE", "0") == "1",
+                budget=float(os.getenv("JOBSPY_HEDGE_BUDGET", 0.05)),
+            )
+        return hedger
+
+
+def hedgers_snapshot() -> dict:
+    with _hedgers_lock:
+        hedgers = list(_hedgers.items())
+    return {name: hedger.snapshot() for name, hedger in hedgers}
+
+
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
@@ -110,4 +433,4 @@ def currency_parser(cur_str):
     else:
         num = float(cur_str)
 
-    return np.round(num, 2)
+    return round(num, 2)
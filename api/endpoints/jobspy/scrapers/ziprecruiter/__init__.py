@@ -10,17 +10,17 @@ from __future__ import annotations
 import math
 import time
 from datetime import datetime
+from threading import Lock
 from typing import Optional, Tuple, Any
 
-from concurrent.futures import ThreadPoolExecutor
-
 from .. import Scraper, ScraperInput, Site
 from ..utils import (
     logger,
-    extract_emails_from_text,
+    analyze_text,
     create_session,
     markdown_converter,
 )
+from ..salary import normalize_interval
 from ...jobs import (
     JobPost,
     Compensation,
@@ -32,6 +32,49 @@ from ...jobs import (
 )
 
 
+class SessionPool:
+    """
+    Long-lived ZipRecruiter sessions, keyed by proxy. Each session runs the
+    cookie priming handshake once per lifetime instead of once per search.
+    """
+
+    def __init__(self, max_idle: int = 8, max_age: float = 60 * 60):
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self._idle: dict[str, list[tuple[Any, float]]] = {}
+        self._lock = Lock()
+
+    def acquire(self, proxy: dict | None) -> tuple[Any, float]:
+        """
+        :return: a primed session and the time it was primed
+        """
+        key = str(proxy)
+        now = time.time()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                session, primed_at = idle.pop()
+                if now - primed_at < self.max_age:
+                    return session, primed_at
+        return self.prime(create_session(proxy)), now
+
+    def release(self, proxy: dict | None, session, primed_at: float) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(str(proxy), [])
+            if len(idle) < self.max_idle:
+                idle.append((session, primed_at))
+
+    @staticmethod
+    def prime(session):
+        data = "event_type=session&logged_in=false&number_of_retry=1&property=model%3AiPhone&property=os%3AiOS&property=locale%3Aen_us&property=app_build_number%3A4734&property=app_version%3A91.0&property=manufacturer%3AApple&property=timestamp%3A2024-01-12T12%3A04%3A42-06%3A00&property=screen_height%3A852&property=os_version%3A16.6.1&property=source%3Ainstall&property=screen_width%3A393&property=device_model%3AiPhone%2014%20Pro&property=brand%3AApple"
+        url = f"{ZipRecruiterScraper.api_url}/jobs-app/event"
+        session.post(url, data=data, headers=ZipRecruiterScraper.headers)
+        return session
+
+
+session_pool = SessionPool()
+
+
 class ZipRecruiterScraper(Scraper):
     base_url = "https://www.ziprecruiter.com"
     api_url = "https://api.ziprecruiter.com"
@@ -41,8 +84,11 @@ class ZipRecruiterScraper(Scraper):
         Initializes ZipRecruiterScraper with the ZipRecruiter job search url
         """
         self.scraper_input = None
-        self.session = create_session(proxy)
-        self._get_cookies()
+        self.session = None
+        self.primed_at = None
+        # set when the session errored or stayed unauthorized after priming
+        # again, so it is dropped instead of going back to the pool
+        self.session_failed = False
         super().__init__(Site.ZIP_RECRUITER, proxy=proxy)
 
         self.delay = 5
@@ -55,6 +101,19 @@ class ZipRecruiterScraper(Scraper):
         :param scraper_input: Information about job search criteria.
         :return: JobResponse containing a list of jobs.
         """
+        self.session, self.primed_at = session_pool.acquire(self.proxy)
+        self.session_failed = False
+        try:
+            response = self._scrape(scraper_input)
+        except Exception:
+            self.session_failed = True
+            raise
+        finally:
+            if not self.session_failed:
+                session_pool.release(self.proxy, self.session, self.primed_at)
+        return response
+
+    def _scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         job_list: list[JobPost] = []
         continue_token = None
@@ -63,8 +122,8 @@ class ZipRecruiterScraper(Scraper):
         for page in range(1, max_pages + 1):
             if len(job_list) >= scraper_input.results_wanted:
                 break
-            if page > 1:
-                time.sleep(self.delay)
+            if page > 1 and not self.pause(self.delay):
+                break
             logger.info(f"ZipRecruiter search page: {page}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
@@ -73,7 +132,7 @@ class ZipRecruiterScraper(Scraper):
                 job_list.extend(jobs_on_page)
             else:
                 break
-            if not continue_token:
+            if not continue_token or not self.page_scraped(len(jobs_on_page)):
                 break
         return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
@@ -94,6 +153,14 @@ class ZipRecruiterScraper(Scraper):
             res = self.session.get(
                 f"{self.api_url}/jobs-app/jobs", headers=self.headers, params=params
             )
+            if res.status_code in (401, 403):
+                # session cookies went stale, prime again and retry once
+                self.session = SessionPool.prime(self.session)
+                self.primed_at = time.time()
+                res = self.session.get(
+                    f"{self.api_url}/jobs-app/jobs", headers=self.headers, params=params
+                )
+                self.session_failed = res.status_code in (401, 403)
             if res.status_code not in range(200, 400):
                 if res.status_code == 429:
                     err = "429 Response - Blocked by ZipRecruiter for too many requests"
@@ -101,21 +168,22 @@ class ZipRecruiterScraper(Scraper):
                     err = f"ZipRecruiter response status code {res.status_code}"
                     err += f" with response: {res.text}"  # ZipRecruiter likely not available in EU
                 logger.error(err)
+                self.error = err
                 return jobs_list, ""
         except Exception as e:
             if "Proxy responded with" in str(e):
                 logger.error(f"Indeed: Bad proxy")
             else:
                 logger.error(f"Indeed: {str(e)}")
+            self.error = str(e)
+            self.session_failed = True
             return jobs_list, ""
 
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
-
-        job_list = list(filter(None, (result.result() for result in job_results)))
+        job_results = self.parse_executor.map(self._process_job, jobs_list)
+        job_list = list(filter(None, job_results))
         return job_list, next_continue_token
 
     def _process_job(self, job: dict) -> JobPost | None:
@@ -145,11 +213,11 @@ class ZipRecruiterScraper(Scraper):
             job.get("employment_type", "").replace("_", "").lower()
         )
         date_posted = datetime.fromisoformat(job["posted_time"].rstrip("Z")).date()
-        comp_interval = job.get("compensation_interval")
-        comp_interval = "yearly" if comp_interval == "annual" else comp_interval
-        comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
-        comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
+        comp_interval = normalize_interval(job.get("compensation_interval"))
+        comp_min = float(job["compensation_min"]) if "compensation_min" in job else None
+        comp_max = float(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
+        analysis = analyze_text(description, title, job.get("job_city"))
         return JobPost(
             title=title,
             company_name=company,
@@ -164,14 +232,10 @@ class ZipRecruiterScraper(Scraper):
             date_posted=date_posted,
             job_url=job_url,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=analysis.emails,
+            is_remote=analysis.remote,
         )
 
-    def _get_cookies(self):
-        data = "event_type=session&logged_in=false&number_of_retry=1&property=model%3AiPhone&property=os%3AiOS&property=locale%3Aen_us&property=app_build_number%3A4734&property=app_version%3A91.0&property=manufacturer%3AApple&property=timestamp%3A2024-01-12T12%3A04%3A42-06%3A00&property=screen_height%3A852&property=os_version%3A16.6.1&property=source%3Ainstall&property=screen_width%3A393&property=device_model%3AiPhone%2014%20Pro&property=brand%3AApple"
-        url = f"{self.api_url}/jobs-app/event"
-        self.session.post(url, data=data, headers=self.headers)
-
     @staticmethod
     def _get_job_type_enum(job_type_str: str) -> list[JobType] | None:
         for job_type in JobType:
@@ -0,0 +1,38 @@
+import logging
+
+from fastapi import APIRouter
+
+from .jobs import admission, result_store, searches
+from .jobspy.scrapers.cache import get_response_cache
+from .jobspy.scrapers.breaker import circuit_breakers_snapshot
+from .jobspy.scrapers.executors import executors_snapshot
+from .jobspy.scrapers.proxies import proxy_pools_snapshot
+from .jobspy.scrapers.utils import hedgers_snapshot
+from .jobspy.planner import site_planner
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1", tags=["metrics"])
+
+
+@router.get("/metrics")
+async def metrics():
+    http_cache = get_response_cache()
+    return {
+        "admission": admission.snapshot(),
+        "result_store": result_store.snapshot(),
+        "searches": searches.snapshot(),
+        "http_cache": http_cache.snapshot() if http_cache else None,
+        "circuit_breakers": circuit_breakers_snapshot(),
+        "proxy_pools": proxy_pools_snapshot(),
+        "hedging": hedgers_snapshot(),
+        "executors": executors_snapshot(),
+    }
+
+
+@router.get("/planner")
+async def planner():
+    """
+    Site statistics by keyword class, and recent plans with their outcomes.
+    """
+    return site_planner.snapshot()
@@ -0,0 +1,178 @@
+"""
+api.middleware
+~~~~~~~~~~~~~~~~~~~
+
+HTTP caching and compression for API responses and static assets.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+from threading import Lock
+
+from cachetools import LRUCache
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "text/html",
+    "text/css",
+    "text/plain",
+    "application/javascript",
+    "text/javascript",
+    "image/svg+xml",
+)
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+class HTTPCacheMiddleware:
+    """
+    Buffers complete (content-length) responses to add a strong ETag, answer
+    conditional GETs with 304, set Cache-Control for static assets and
+    compress the body with brotli or gzip above ``minimum_size`` bytes.
+    Streaming responses are passed through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        max_buffer_size: int = 16 * 1024 * 1024,
+        static_prefix: str = "/static/",
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.max_buffer_size = max_buffer_size
+        self.static_prefix = static_prefix
+        # compressed bodies by (etag, encoding); static files and re-read
+        # result pages are served many times with identical content
+        self._compressed: LRUCache = LRUCache(maxsize=256)
+        self._lock = Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        chunks: list[bytes] = []
+        passthrough = False
+
+        async def buffered_send(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                length = headers.get("content-length")
+                if (
+                    message["status"] != 200
+                    or length is None
+                    or int(length) > self.max_buffer_size
+                    or "content-encoding" in headers
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                await self.respond(scope, start_message, b"".join(chunks), send)
+
+        await self.app(scope, receive, buffered_send)
+
+    async def respond(
+        self, scope: Scope, start_message: Message, body: bytes, send: Send
+    ) -> None:
+        request_headers = Headers(scope=scope)
+        headers = MutableHeaders(raw=list(start_message["headers"]))
+        path = scope["path"]
+
+        etag = headers.get("etag") or f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        headers["etag"] = etag
+        if path.startswith(self.static_prefix):
+            versioned = b"v=" in scope.get("query_string", b"")
+            headers["cache-control"] = IMMUTABLE if versioned else REVALIDATE
+        elif path == "/":
+            headers["cache-control"] = REVALIDATE
+
+        encoding = self.choose_encoding(request_headers, headers, body)
+        if encoding:
+            headers.add_vary_header("Accept-Encoding")
+
+        if scope["method"] == "GET" and self.etag_matches(
+            request_headers.get("if-none-match"), etag
+        ):
+            del headers["content-length"]
+            if "content-type" in headers:
+                del headers["content-type"]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if encoding:
+            body = self.compress(body, etag, encoding)
+            headers["content-encoding"] = encoding
+            headers["etag"] = f'{etag[:-1]}-{encoding}"'
+            headers["content-length"] = str(len(body))
+
+        await send({**start_message, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+    def choose_encoding(
+        self, request_headers: Headers, headers: MutableHeaders, body: bytes
+    ) -> str | None:
+        if len(body) < self.minimum_size:
+            return None
+        content_type = headers.get("content-type", "").split(";")[0].strip()
+        if content_type not in COMPRESSIBLE_TYPES:
+            return None
+        accepted = request_headers.get("accept-encoding", "")
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def compress(self, body: bytes, etag: str, encoding: str) -> bytes:
+        key = (etag, encoding)
+        with self._lock:
+            cached = self._compressed.get(key)
+        if cached is not None:
+            return cached
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=5)
+        else:
+            compressed = gzip.compress(body, compresslevel=6)
+        with self._lock:
+            self._compressed[key] = compressed
+        return compressed
+
+    @staticmethod
+    def etag_matches(if_none_match: str | None, etag: str) -> bool:
+        """
+        Compares If-None-Match against the identity ETag, accepting the
+        encoding-suffixed variants handed out with compressed bodies.
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip().removeprefix("W/")
+            for encoding in ("-br", "-gzip"):
+                if candidate.endswith(f'{encoding}"'):
+                    candidate = candidate[: -len(encoding) - 1] + '"'
+            if candidate == etag:
+                return True
+        return False
@@ -0,0 +1,247 @@
+"""
+api.searches
+~~~~~~~~~~~~~~~~~~~
+
+Background execution of submitted searches: a fixed pool of worker threads
+fed from a queue that is fair across clients, with per-site progress and a
+bounded, TTL-bound store of finished search states for polling.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import uuid
+import asyncio
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from threading import Condition, Lock, Thread
+from typing import AsyncContextManager, Callable
+
+from cachetools import TTLCache
+from fastapi import HTTPException
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Search:
+    def __init__(self, client: str, key: str, params):
+        self.id = uuid.uuid4().hex
+        self.client = client
+        self.key = key
+        self.params = params
+        self.status = QUEUED
+        self.sites: dict[str, dict] = {}
+        self.result_id: str | None = None
+        self.error: str | None = None
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._lock = Lock()
+
+    def update_site(self, site: str, status: str, jobs: int = 0) -> None:
+        """
+        Progress callback handed to scrape_jobs, called from scraper threads.
+        """
+        with self._lock:
+            self.sites[site] = {"status": status, "jobs": jobs}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            sites = {site: dict(progress) for site, progress in self.sites.items()}
+        return {
+            "search_id": self.id,
+            "status": self.status,
+            "sites": sites,
+            "result_id": self.result_id,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class SearchRunner:
+    def __init__(
+        self,
+        execute: Callable[[Search], str],
+        workers: int = 4,
+        max_queued: int = 64,
+        client_queued: int = 8,
+        maxsize: int = 1024,
+        ttl: int = 900,
+        admit: Callable[[], AsyncContextManager] | None = None,
+    ):
+        """
+        :param execute: runs a search and returns the id of its result set
+        :param workers: searches scraped at once
+        :param max_queued: searches allowed to wait before submissions get 503s
+        :param client_queued: searches one client may have waiting at once
+        :param maxsize: finished search states retained for polling
+        :param ttl: seconds a finished search state is retained
+        :param admit: slot a worker holds while it scrapes, entered on the
+            event loop the searches were submitted from; shares the API's
+            global scrape cap with foreground searches
+        """
+        self.execute = execute
+        self.workers = workers
+        self.max_queued = max_queued
+        self.client_queued = client_queued
+        self.admit = admit
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self._searches: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # queued or running searches by id; they only start to expire once
+        # they finish and move to _searches
+        self._pending: dict[str, Search] = {}
+        # queued or running searches by key, so resubmits join them
+        self._active: dict[str, Search] = {}
+        # one queue per client, served round-robin so a client submitting a
+        # large batch can't starve everybody else
+        self._queues: OrderedDict[str, deque] = OrderedDict()
+        self._queued = 0
+        self._condition = Condition()
+        self._threads: list[Thread] = []
+        self.running = 0
+        self.counters: Counter = Counter()
+
+    def submit(self, client: str, key: str, params) -> Search:
+        """
+        Queues a search, or returns the queued or running one with the same key
+        :raises HTTPException: 429 when the client has too many searches
+            waiting, 503 when the queue is full
+        """
+        with self._condition:
+            active = self._active.get(key)
+            if active is not None:
+                self.counters["joined"] += 1
+                return active
+            if len(self._queues.get(client, ())) >= self.client_queued:
+                self._reject("client_busy", 429, "Too many queued searches")
+            if self._queued >= self.max_queued:
+                self._reject("queue_full", 503, "Too many searches queued")
+            if self.admit is not None and self._loop is None:
+                self._loop = asyncio.get_running_loop()
+            self._start_workers()
+            search = Search(client, key, params)
+            self._active[key] = search
+            self._queues.setdefault(client, deque()).append(search)
+            self._queued += 1
+            self._pending[search.id] = search
+            self.counters["submitted"] += 1
+            self._condition.notify()
+        return search
+
+    def complete(self, client: str, key: str, params, result_id: str) -> Search:
+        """
+        Records a search that was answered without scraping.
+        """
+        search = Search(client, key, params)
+        search.status = DONE
+        search.result_id = result_id
+        search.started_at = search.finished_at = search.created_at
+        with self._condition:
+            self._searches[search.id] = search
+            self.counters["completed_cached"] += 1
+        return search
+
+    def get(self, search_id: str) -> Search | None:
+        with self._condition:
+            return self._pending.get(search_id) or self._searches.get(search_id)
+
+    def position(self, search: Search) -> int | None:
+        """
+        Approximate number of searches that will start before this one.
+        """
+        with self._condition:
+            if search.status != QUEUED:
+                return None
+            queue = self._queues.get(search.client)
+            if not queue or search not in queue:
+                return None
+            ahead = queue.index(search)
+            # every other client gets a turn per round
+            return sum(min(len(q), ahead + 1) for q in self._queues.values()) - 1
+
+    def _start_workers(self) -> None:
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = Thread(target=self._work, name=f"search-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _next(self) -> Search:
+        with self._condition:
+            while not self._queued:
+                self._condition.wait()
+            client, queue = next(iter(self._queues.items()))
+            search = queue.popleft()
+            if queue:
+                self._queues.move_to_end(client)
+            else:
+                del self._queues[client]
+            self._queued -= 1
+            self.running += 1
+            return search
+
+    @contextmanager
+    def _slot(self):
+        """
+        Holds the admit slot, if any, from a worker thread.
+        """
+        if self.admit is None:
+            yield
+            return
+        slot = self.admit()
+        asyncio.run_coroutine_threadsafe(slot.__aenter__(), self._loop).result()
+        try:
+            yield
+        finally:
+            asyncio.run_coroutine_threadsafe(
+                slot.__aexit__(None, None, None), self._loop
+            ).result()
+
+    def _work(self) -> None:
+        while True:
+            search = self._next()
+            try:
+                with self._slot():
+                    search.status = RUNNING
+                    search.started_at = time.time()
+                    search.result_id = self.execute(search)
+                search.status = DONE
+                self.counters["completed"] += 1
+            except Exception as e:
+                search.error = str(e) or e.__class__.__name__
+                search.status = FAILED
+                self.counters["failed"] += 1
+            finally:
+                search.finished_at = time.time()
+                with self._condition:
+                    self.running -= 1
+                    del self._active[search.key]
+                    del self._pending[search.id]
+                    self._searches[search.id] = search
+
+    def _reject(self, reason: str, status_code: int, detail: str):
+        self.counters[f"rejected_{reason}"] += 1
+        raise HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": str(math.ceil(max(1, self._queued / self.workers)))},
+        )
+
+    def snapshot(self) -> dict:
+        with self._condition:
+            return {
+                "workers": self.workers,
+                "running": self.running,
+                "queued": self._queued,
+                "clients_queued": len(self._queues),
+                "retained": len(self._searches) + len(self._pending),
+                **self.counters,
+            }
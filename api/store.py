@@ -0,0 +1,199 @@
+"""
+api.store
+~~~~~~~~~~~~~~~~~~~
+
+Server-side store for scraped result sets, so clients can filter, sort and
+page through a search without re-scraping or downloading every job.
+"""
+
+from __future__ import annotations
+
+import re
+import html
+import uuid
+import time
+import hashlib
+from datetime import date, timedelta
+from threading import Lock
+
+from cachetools import TTLCache
+
+SORT_OPTIONS = ("date_desc", "date_asc", "salary_desc", "title", "company", "site")
+
+# Fields returned per job by the list endpoints; the full record is served
+# by the job detail endpoint
+LIST_FIELDS = (
+    "id",
+    "site",
+    "job_url",
+    "title",
+    "company",
+    "location",
+    "job_type",
+    "date_posted",
+    "is_remote",
+    "interval",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "annual_min_amount",
+    "annual_max_amount",
+    "annual_currency",
+    "logo_photo_url",
+)
+
+TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def job_id(job: dict) -> str:
+    """
+    Stable id for a job, derived from its url.
+    """
+    return hashlib.sha1(job["job_url"].encode()).hexdigest()[:16]
+
+
+def snippet(description: str | None, length: int) -> str:
+    """
+    Plain text preview of a (possibly html) description.
+    """
+    if not description or length <= 0:
+        return ""
+    text = WHITESPACE_RE.sub(" ", html.unescape(TAG_RE.sub(" ", description))).strip()
+    return text if len(text) <= length else text[:length].rstrip() + "..."
+
+
+def project(job: dict, snippet_length: int = 150) -> dict:
+    """
+    Compact list view of a job.
+    """
+    compact = {field: job.get(field) for field in LIST_FIELDS}
+    compact["snippet"] = snippet(job.get("description"), snippet_length)
+    return compact
+
+
+class ResultSet:
+    def __init__(
+        self,
+        key: str,
+        jobs: list[dict],
+        degraded: list[str] | None = None,
+        plan: dict | None = None,
+    ):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.jobs = jobs
+        # sites that errored or were skipped by their circuit breaker
+        self.degraded = sorted(degraded or ())
+        # site plan and its outcome, for planned searches
+        self.plan = plan
+        self.created_at = time.time()
+
+    def query(
+        self,
+        site: list[str] | None = None,
+        job_type: str | None = None,
+        is_remote: bool | None = None,
+        days: int | None = None,
+        min_salary: float | None = None,
+        sort: str = "date_desc",
+    ) -> list[dict]:
+        """
+        Filters and sorts the stored jobs
+        :return: the matching jobs, in the requested order
+        """
+        jobs = self.jobs
+        if site:
+            jobs = [job for job in jobs if job["site"] in site]
+        if job_type:
+            job_type = job_type.lower()
+            jobs = [job for job in jobs if job_type in (job["job_type"] or "").lower()]
+        if is_remote is not None:
+            jobs = [job for job in jobs if bool(job["is_remote"]) == is_remote]
+        if days is not None:
+            cutoff = date.today() - timedelta(days=days)
+            jobs = [
+                job
+                for job in jobs
+                if job["date_posted"] is not None and job["date_posted"] >= cutoff
+            ]
+        if min_salary is not None:
+            jobs = [job for job in jobs if (annual_pay(job) or 0) >= min_salary]
+        return sort_jobs(jobs, sort)
+
+
+def annual_pay(job: dict) -> float | None:
+    """
+    Top of the annualized pay range, in the result set's annual currency.
+    """
+    return job.get("annual_max_amount") or job.get("annual_min_amount")
+
+
+def sort_jobs(jobs: list[dict], sort: str) -> list[dict]:
+    """
+    Sorts jobs by the given option, rows missing the sort field go last.
+    """
+    if sort not in SORT_OPTIONS:
+        raise ValueError(f"Invalid sort: {sort}")
+    if sort in ("date_desc", "date_asc"):
+        dated = [job for job in jobs if job["date_posted"] is not None]
+        undated = [job for job in jobs if job["date_posted"] is None]
+        dated.sort(key=lambda job: job["date_posted"], reverse=sort == "date_desc")
+        return dated + undated
+    if sort == "salary_desc":
+        paid = [job for job in jobs if annual_pay(job)]
+        unpaid = [job for job in jobs if not annual_pay(job)]
+        paid.sort(key=annual_pay, reverse=True)
+        return paid + unpaid
+    return sorted(jobs, key=lambda job: ((job[sort] or "").lower(), job["title"] or ""))
+
+
+class ResultStore:
+    """
+    Bounded, TTL-bound store of result sets, addressable by id and by the
+    search that produced them, plus an index of the individual jobs.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: int = 900, max_jobs: int = 20000):
+        self._by_id: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._by_key: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._jobs: TTLCache = TTLCache(maxsize=max_jobs, ttl=ttl)
+        self._lock = Lock()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"result_sets": len(self._by_id), "jobs": len(self._jobs)}
+
+    def get_job(self, job_id: str) -> dict | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get(self, result_id: str) -> ResultSet | None:
+        with self._lock:
+            return self._by_id.get(result_id)
+
+    def find(self, key: str) -> ResultSet | None:
+        with self._lock:
+            return self._by_key.get(key)
+
+    def put(
+        self,
+        key: str,
+        jobs: list[dict],
+        degraded: list[str] | None = None,
+        plan: dict | None = None,
+    ) -> ResultSet:
+        """
+        Stores a result set. Results missing degraded sites are addressable
+        by id only, so the next identical search scrapes again.
+        """
+        for job in jobs:
+            job["id"] = job_id(job)
+        result_set = ResultSet(key, jobs, degraded, plan)
+        with self._lock:
+            for job in jobs:
+                self._jobs[job["id"]] = job
+            self._by_id[result_set.id] = result_set
+            if not result_set.degraded:
+                self._by_key[key] = result_set
+        return result_set
@@ -0,0 +1,65 @@
+"""
+benchmarks.import_time
+~~~~~~~~~~~~~~~~~~~
+
+Measures cold-start import cost with ``python -X importtime``.
+
+Usage:
+    python -m benchmarks.import_time [module ...] [--top N]
+"""
+
+from __future__ import annotations
+
+import sys
+import argparse
+import subprocess
+
+DEFAULT_MODULES = ["main", "api.endpoints.jobs"]
+# Heavy dependencies that must not be imported until a search needs them
+LAZY_MODULES = ["pandas", "numpy", "tls_client", "bs4", "markdownify"]
+
+
+def measure(module: str) -> list[tuple[int, int, str]]:
+    """
+    Imports the module in a fresh interpreter.
+    :return: (self_us, cumulative_us, name) for every imported module
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def summarize(module: str, top: int) -> None:
+    rows = measure(module)
+    total = next(cum for _, cum, name in reversed(rows) if name == module)
+    loaded = {name for _, _, name in rows}
+    print(f"{module}: {total / 1000:.1f} ms cumulative, {len(rows)} modules")
+    for _, cumulative_us, name in sorted(rows, key=lambda r: -r[1])[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    if eager:
+        print(f"  eagerly imported: {', '.join(eager)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    for module in args.modules:
+        summarize(module, args.top)
+
+
+if __name__ == "__main__":
+    main()
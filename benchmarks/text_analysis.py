@@ -0,0 +1,79 @@
+"""
+benchmarks.text_analysis
+~~~~~~~~~~~~~~~~~~~
+
+Compares the shared job text analyzer (analyze_text) against the previous
+per-job email regex plus per-keyword remote checks.
+
+Usage:
+    python -m benchmarks.text_analysis [--corpus descriptions.jsonl] [--repeat N]
+
+The corpus is one JSON object per line with a "description" key, e.g. jobs
+exported from /api/v1/results; without one a synthetic corpus is used.
+"""
+
+from __future__ import annotations
+
+import re
+import json
+import random
+import argparse
+import timeit
+
+from api.endpoints.jobspy.scrapers.utils import analyze_text
+
+REMOTE_KEYWORDS = ["remote", "work from home", "wfh"]
+PARAGRAPHS = [
+    "<p>We are looking for an experienced engineer to join our platform team.</p>",
+    "<p>You will own services end to end, from design through to production support.</p>",
+    "<ul><li>5+ years of Python</li><li>Experience with PostgreSQL and Redis</li></ul>",
+    "<p>This is a hybrid role with two days a week in our London office.</p>",
+    "<p>Fully remote within the UK; occasional travel for team meetups.</p>",
+    "<p>Flexible working, including work from home on Fridays.</p>",
+    "<p>Send your CV to careers@example.co.uk or hr.team@example.com.</p>",
+    "<p>Competitive salary, 25 days holiday, pension and private healthcare.</p>",
+]
+
+
+def legacy(description: str) -> tuple[list[str], bool]:
+    emails = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}").findall(description)
+    remote = any(keyword in description.lower() for keyword in REMOTE_KEYWORDS)
+    return emails, remote
+
+
+def shared(description: str) -> tuple[list[str] | None, bool]:
+    analysis = analyze_text(description)
+    return analysis.emails, analysis.remote
+
+
+def synthetic_corpus(size: int = 2000, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "\n".join(rng.choices(PARAGRAPHS, k=rng.randint(6, 40))) for _ in range(size)
+    ]
+
+
+def load_corpus(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        rows = (json.loads(line) for line in f if line.strip())
+        return [row["description"] for row in rows if row.get("description")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", help="JSONL file of recorded job descriptions")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    size = sum(len(text) for text in corpus)
+    print(f"{len(corpus)} descriptions, {size / 1e6:.1f} MB")
+    for name, analyze in (("legacy", legacy), ("shared", shared)):
+        seconds = min(
+            timeit.repeat(lambda: [analyze(text) for text in corpus], number=1, repeat=args.repeat)
+        )
+        remote = sum(bool(analyze(text)[1]) for text in corpus)
+        print(f"  {name:12} {seconds * 1000:8.1f} ms  {size / seconds / 1e6:6.1f} MB/s  remote={remote}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 import asyncio
+import hashlib
+import os
+import re
+from functools import lru_cache
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from api.endpoints import jobs
+from api.endpoints import jobs, metrics
+from api.middleware import HTTPCacheMiddleware
 
 
 app = FastAPI(
@@ -32,17 +37,42 @@ app.add_middleware(
     allow_headers=["*"],
     allow_credentials=True,
 )
+app.add_middleware(HTTPCacheMiddleware, minimum_size=1024)
 
 # Endpoints
 app.include_router(jobs.router)
+app.include_router(metrics.router)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+STATIC_ASSET_RE = re.compile(r'(?P<attr>(?:href|src)=")/static/(?P<path>[^"?]+)"')
+
+
+@lru_cache(maxsize=8)
+def render_index(mtime: float) -> str:
+    """
+    Rewrites static asset urls in index.html with a content-hash version so
+    they can be cached as immutable; re-rendered whenever index.html changes.
+    """
+
+    def versioned(match: re.Match) -> str:
+        path = match.group("path")
+        with open(os.path.join("static", path), "rb") as asset:
+            digest = hashlib.sha256(asset.read()).hexdigest()[:12]
+        return f'{match.group("attr")}/static/{path}?v={digest}"'
+
+    with open("static/index.html", encoding="utf-8") as index:
+        return STATIC_ASSET_RE.sub(versioned, index.read())
+
+
 @app.get("/")
 async def root():
-    return FileResponse('static/index.html')
+    mtime = max(
+        os.path.getmtime(os.path.join("static", name)) for name in os.listdir("static")
+    )
+    return HTMLResponse(render_index(mtime))
 
 # This line is removed as it was causing the issue
 # loop = asyncio.get_event_loop()
@@ -4,7 +4,11 @@ document.addEventListener('DOMContentLoaded', () => {
     const resultsContainer = document.getElementById('results-container');
     const filtersSection = document.getElementById('filters-section');
 
-    let allJobs = []; // Store all jobs for filtering
+    const PAGE_SIZE = 20;
+
+    let resultId = null; // Server-side result set for the current search
+    let currentPage = 1;
+    let totalPages = 0;
     let activeFilters = {
         site: 'all',
         type: 'all',
@@ -25,7 +29,7 @@ document.addEventListener('DOMContentLoaded', () => {
         filtersSection.style.display = 'none';
 
         try {
-            const response = await fetch('/api/v1/jobs', {
+            const response = await fetch(`/api/v1/jobs?${buildQuery(1)}`, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -38,31 +42,50 @@ document.addEventListener('DOMContentLoaded', () => {
             }
 
             const data = await response.json();
-            allJobs = data.data || [];
-
-            // Sort by date descending (newest first)
-            allJobs.sort((a, b) => {
-                const dateA = a.date_posted ? new Date(a.date_posted) : new Date(0);
-                const dateB = b.date_posted ? new Date(b.date_posted) : new Date(0);
-                return dateB - dateA;
-            });
+            resultId = data.result_id;
 
             // Show filters and render jobs
-            if (allJobs.length > 0) {
+            if (data.total > 0) {
                 filtersSection.style.display = 'block';
             }
-            renderJobs(allJobs);
+            renderPage(data, false);
         } catch (error) {
-            console.error(error);
-            resultsContainer.innerHTML = `
-                <div class="error-msg">
-                    <h3>Oops! Something went wrong.</h3>
-                    <p>Please try again later.</p>
-                </div>
-            `;
+            showError(error);
         }
     });
 
+    function buildQuery(page) {
+        const params = new URLSearchParams({ page, limit: PAGE_SIZE, sort: 'date_desc' });
+        if (activeFilters.site !== 'all') params.set('site', activeFilters.site);
+        if (activeFilters.type !== 'all') params.set('job_type', activeFilters.type);
+        if (activeFilters.remote !== 'all') params.set('is_remote', activeFilters.remote);
+        if (activeFilters.days !== 'all') params.set('days', activeFilters.days);
+        return params.toString();
+    }
+
+    async function fetchPage(page, append) {
+        if (!resultId) return;
+        try {
+            const response = await fetch(`/api/v1/results/${resultId}?${buildQuery(page)}`);
+            if (!response.ok) {
+                throw new Error('Failed to fetch jobs');
+            }
+            renderPage(await response.json(), append);
+        } catch (error) {
+            showError(error);
+        }
+    }
+
+    function showError(error) {
+        console.error(error);
+        resultsContainer.innerHTML = `
+            <div class="error-msg">
+                <h3>Oops! Something went wrong.</h3>
+                <p>Please try again later.</p>
+            </div>
+        `;
+    }
+
     function initializeFilters() {
         // Site filters
         document.querySelectorAll('#site-filters .filter-pill').forEach(pill => {
@@ -121,47 +144,22 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     function applyFilters() {
-        let filteredJobs = [...allJobs];
-
-        // Filter by site
-        if (activeFilters.site !== 'all') {
-            filteredJobs = filteredJobs.filter(job => job.site === activeFilters.site);
-        }
-
-        // Filter by type
-        if (activeFilters.type !== 'all') {
-            filteredJobs = filteredJobs.filter(job => {
-                const jobType = (job.job_type || '').toLowerCase();
-                return jobType.includes(activeFilters.type);
-            });
-        }
-
-        // Filter by remote
-        if (activeFilters.remote !== 'all') {
-            const isRemoteFilter = activeFilters.remote === 'true';
-            filteredJobs = filteredJobs.filter(job => job.is_remote === isRemoteFilter);
-        }
-
-        // Filter by date
-        if (activeFilters.days !== 'all') {
-            const daysAgo = parseInt(activeFilters.days);
-            const cutoffDate = new Date();
-            cutoffDate.setDate(cutoffDate.getDate() - daysAgo);
-
-            filteredJobs = filteredJobs.filter(job => {
-                if (!job.date_posted) return false;
-                const jobDate = new Date(job.date_posted);
-                return jobDate >= cutoffDate;
-            });
-        }
+        // Filtering happens server-side against the stored result set
+        fetchPage(1, false);
+    }
 
-        renderJobs(filteredJobs);
+    function renderPage(data, append) {
+        currentPage = data.page;
+        totalPages = data.pages;
+        renderJobs(data.data, append);
     }
 
-    function renderJobs(jobs) {
-        resultsContainer.innerHTML = '';
+    function renderJobs(jobs, append) {
+        const loadMore = document.getElementById('load-more');
+        if (loadMore) loadMore.remove();
+        if (!append) resultsContainer.innerHTML = '';
 
-        if (!jobs || jobs.length === 0) {
+        if (!append && (!jobs || jobs.length === 0)) {
             resultsContainer.innerHTML = '<p style="text-align:center; width:100%; color: var(--text-secondary);">No jobs found matching your filters. Try adjusting your criteria.</p>';
             return;
         }
@@ -192,7 +190,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const logo = job.logo_photo_url || null;
             const site = job.site || 'Source';
 
-            const description = stripHtml(job.description || '').substring(0, 150) + '...';
+            const description = job.snippet || '';
 
             const logoHtml = logo
                 ? `<img src="${logo}" alt="${company} logo" class="company-logo" onerror="this.style.display='none'">`
@@ -221,11 +219,15 @@ document.addEventListener('DOMContentLoaded', () => {
 
             resultsContainer.appendChild(card);
         });
-    }
 
-    function stripHtml(html) {
-        let tmp = document.createElement("DIV");
-        tmp.innerHTML = html;
-        return tmp.textContent || tmp.innerText || "";
+        if (currentPage < totalPages) {
+            const button = document.createElement('button');
+            button.id = 'load-more';
+            button.className = 'clear-filters-btn';
+            button.style.gridColumn = '1 / -1';
+            button.textContent = 'Load More Jobs';
+            button.addEventListener('click', () => fetchPage(currentPage + 1, true));
+            resultsContainer.appendChild(button);
+        }
     }
 });